@@ -14,10 +14,7 @@ until curl -s "${QDRANT_URL}/healthz" > /dev/null; do
 done
 echo "Qdrant is ready!"
 
-# Run initial indexing
-echo "Running initial indexing..."
-uv run python -m src.indexer.run_initial_index
-
-# Start file watcher daemon
+# Start file watcher daemon (runs the initial index in-process first, so the
+# embedding model and Qdrant connection are loaded only once)
 echo "Starting file watcher daemon..."
 exec uv run python -m src.watcher.run_daemon
@@ -28,4 +28,9 @@ if not os.getenv("ANTHROPIC_BASE_URL") and os.getenv("OPENAI_API_BASE"):
 from src.cli import main
 
 if __name__ == "__main__":
+    # Configure logging before any module logger is first used (loggers are
+    # cached on first use); importing the CLI logs nothing
+    from src.logging_config import configure_logging
+
+    configure_logging()
     main()
@@ -3,18 +3,135 @@
 This agent uses the Claude Agent SDK with custom tools for research operations.
 """
 
+import functools
+import mmap
 import os
 from pathlib import Path
 
 import structlog
 from claude_agent_sdk import ClaudeAgentOptions, create_sdk_mcp_server
 
+from . import json_utils
+from .response_cache import ResponseCache
 from .skill_loader import load_all_skills
 from .tools import ALL_TOOLS, initialize_rag
 
 logger = structlog.get_logger()
 
 
+OUTLINE_PATH = Path(__file__).parent.parent / "data" / "outline.txt"
+
+# Outline bytes embedded in the system prompt; longer outlines are truncated
+MAX_OUTLINE_BYTES = int(os.getenv("MAX_OUTLINE_BYTES", 32768))
+
+# Book context persisted across processes, reused while its sources are
+# unchanged (set BWB_DISABLE_CTX_CACHE=1 to always rebuild)
+BOOK_CONTEXT_CACHE_PATH = Path(__file__).parent.parent / "data" / "book_context.json"
+
+# (source fingerprint, context text, assembled system prompt) from the last
+# get_book_context() load; the prompt is built lazily by get_system_prompt()
+_book_context_cache = {"key": None, "value": None, "prompt": None}
+
+
+def _book_context_key() -> tuple:
+    """Fingerprint the book context sources by path and modification time."""
+    scrivener_path = os.getenv("SCRIVENER_PROJECT_PATH")
+    manuscript_folder = os.getenv("SCRIVENER_MANUSCRIPT_FOLDER", "")
+
+    scrivx_mtimes = ()
+    if scrivener_path and Path(scrivener_path).is_dir():
+        scrivx_mtimes = tuple(
+            (p.name, p.stat().st_mtime_ns)
+            for p in Path(scrivener_path).glob("*.scrivx")
+        )
+
+    try:
+        outline_mtime = OUTLINE_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        outline_mtime = None
+
+    return (scrivener_path, manuscript_folder, scrivx_mtimes, outline_mtime)
+
+
+def get_book_context() -> str:
+    """Get the book context, reloading only when its source files change.
+
+    Returns:
+        Context text from load_book_context(), cached until the .scrivx
+        project file, outline.txt, or the Scrivener settings change
+    """
+    key = _book_context_key()
+    if _book_context_cache["key"] != key:
+        _book_context_cache["value"] = _load_book_context_cached(key)
+        _book_context_cache["prompt"] = None
+        _book_context_cache["key"] = key
+    return _book_context_cache["value"]
+
+
+def _load_book_context_cached(key: tuple) -> str:
+    """Load the book context from the on-disk cache, rebuilding on a miss.
+
+    Skips the Scrivener XML parse on process start when neither the project
+    nor outline.txt has changed since the context was last built.
+
+    Args:
+        key: Source fingerprint from _book_context_key()
+
+    Returns:
+        Book context text
+    """
+    if os.getenv("BWB_DISABLE_CTX_CACHE") == "1":
+        return load_book_context()
+
+    digest = ResponseCache.make_key("book_context", key, MAX_OUTLINE_BYTES)
+    try:
+        cached = json_utils.loads(BOOK_CONTEXT_CACHE_PATH.read_bytes())
+        if cached.get("key") == digest:
+            return cached["value"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass  # Missing or unreadable cache; rebuild below
+
+    value = load_book_context()
+    try:
+        BOOK_CONTEXT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BOOK_CONTEXT_CACHE_PATH.write_text(
+            json_utils.dumps({"key": digest, "value": value})
+        )
+    except OSError as e:
+        logger.debug("Could not write book context cache", error=str(e))
+    return value
+
+
+def read_outline(path: Path = OUTLINE_PATH, max_bytes: int = MAX_OUTLINE_BYTES) -> str:
+    """Read at most max_bytes of the outline without loading the whole file.
+
+    Args:
+        path: Outline file path
+        max_bytes: Byte cap; the text is cut back to the last paragraph break
+            before the cap and a truncation note is appended
+
+    Returns:
+        Outline text
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if size <= max_bytes:
+                return data[:].decode("utf-8", errors="ignore")
+            head = data[:max_bytes]
+
+    # Drop the partial paragraph (and any split UTF-8 sequence) at the cut
+    cut = head.rfind(b"\n\n")
+    text = head[: cut if cut > 0 else max_bytes].decode("utf-8", errors="ignore")
+    logger.warning("Outline truncated", size=size, max_bytes=max_bytes)
+    return (
+        text.rstrip() + f"\n\n[Outline truncated at {max_bytes} of {size} bytes; "
+        "raise MAX_OUTLINE_BYTES to include the rest.]"
+    )
+
+
 def load_book_context() -> str:
     """Load book context from Scrivener structure and outline.txt."""
     parts = []
@@ -37,9 +154,11 @@ def load_book_context() -> str:
         parts.append("# Scrivener Structure\n\nPath not configured in .env\n")
 
     # 2. Get narrative outline (provides context, themes, descriptions)
-    outline_path = Path(__file__).parent.parent / "data" / "outline.txt"
-    if outline_path.exists():
-        parts.append("# Book Outline & Context\n\n" + outline_path.read_text())
+    if OUTLINE_PATH.exists():
+        # Normalize line endings so the prompt bytes don't depend on the editor
+        parts.append(
+            "# Book Outline & Context\n\n" + read_outline().replace("\r\n", "\n")
+        )
     else:
         parts.append(
             "# Book Outline\n\nNo outline file found. "
@@ -49,10 +168,10 @@ def load_book_context() -> str:
     return "\n\n---\n\n".join(parts)
 
 
-BOOK_CONTEXT = load_book_context()
-
-
-SYSTEM_PROMPT = f"""You are an AI research assistant helping an author analyze their book research materials.
+# Static instructions first and the book context last, so the prompt prefix
+# is byte-identical across sessions and stays a provider prompt-cache hit even
+# after the outline or Scrivener structure changes
+SYSTEM_PROMPT_INSTRUCTIONS = """You are an AI research assistant helping an author analyze their book research materials.
 
 # Your Capabilities
 
@@ -62,13 +181,16 @@ You have DIRECT ACCESS to a vector database containing:
 - **All Scrivener content**: Chapter drafts, research notes, outlines, synopses
 - **Indexed by chapter**: Each chunk tagged with chapter number for filtering
 
-You can query this data using 12 powerful tools:
+You can query this data using 14 powerful tools:
 
 **Core Research:**
 - search_research: Semantic search with optional chapter and source_type filters
   * source_type="zotero" → Search ONLY published research papers, articles, books
   * source_type="scrivener" → Search ONLY manuscript drafts and notes
   * source_type=None → Search BOTH (default)
+- search_research_batch: Several searches in one call (same filters); use instead of
+  repeated search_research calls when a question needs multiple queries
+- find_facts: Statistics, quotes, definitions, and examples on a topic
 - get_annotations: Zotero highlights and notes
 - get_chapter_info: Detailed chapter statistics
 - list_chapters: Book structure from Scrivener
@@ -99,10 +221,6 @@ Use skills for complex requests that require multiple tools. Use individual tool
 When you invoke a skill, it will provide guidance on which tools to use next - follow that guidance
 to complete the workflow.
 
-# Book Context
-
-{BOOK_CONTEXT}
-
 # How to Respond to Queries
 
 1. **Plan Your Research**: Think about what tools will help answer the question
@@ -170,6 +288,65 @@ Structure your responses as:
 Use markdown formatting for clarity.
 """
 
+BOOK_CONTEXT_HEADING = "\n# Book Context\n\n"
+
+
+def get_system_prompt() -> str:
+    """Build the system prompt: static instructions followed by the book context.
+
+    The assembled prompt is cached alongside the book context, so sessions
+    created while the context is unchanged share one string.
+    """
+    context = get_book_context()
+    if _book_context_cache["prompt"] is None:
+        _book_context_cache["prompt"] = "".join(
+            (SYSTEM_PROMPT_INSTRUCTIONS, BOOK_CONTEXT_HEADING, context)
+        )
+    return _book_context_cache["prompt"]
+
+
+@functools.lru_cache(maxsize=1)
+def get_agent_tools() -> tuple:
+    """Build the combined research tool and workflow skill list once.
+
+    Skill markdown parsing and tool construction don't depend on the model, so
+    model switches and session resets reuse the same immutable tuple.
+
+    Returns:
+        Tuple of all tools exposed to the agent
+    """
+    # Load workflow skills (from code + markdown files)
+    all_skills = load_all_skills()
+
+    # Combine tools and skills
+    all_tools = tuple(ALL_TOOLS) + tuple(all_skills)
+
+    logger.info(
+        "Agent tools loaded",
+        core_tools=len(ALL_TOOLS),
+        workflow_skills=len(all_skills),
+        total=len(all_tools),
+    )
+    return all_tools
+
+
+@functools.lru_cache(maxsize=1)
+def get_mcp_server():
+    """Wrap the agent tools in an in-process MCP server once.
+
+    SdkMcpTools (created by the @tool decorator) must be wrapped in an MCP
+    server; they cannot be passed directly to the tools parameter. Sessions
+    are sequential, so model switches and resets reuse the same server.
+
+    Returns:
+        SDK MCP server config for ClaudeAgentOptions.mcp_servers
+    """
+    return create_sdk_mcp_server(
+        name="book-research",
+        version="1.0.0",
+        tools=list(get_agent_tools()),  # All @tool decorated functions go here
+    )
+
 
 def create_agent_options() -> ClaudeAgentOptions:
     """Create Claude Agent SDK options.
@@ -182,9 +359,8 @@ def create_agent_options() -> ClaudeAgentOptions:
     api_base = os.getenv("OPENAI_API_BASE", "")
 
     # Determine if we're using LiteLLM proxy
-    using_litellm = bool(
-        api_base and ("litellm" in api_base.lower() or "cornell" in api_base.lower())
-    )
+    api_base_lower = api_base.lower()
+    using_litellm = "litellm" in api_base_lower or "cornell" in api_base_lower
 
     # Get model from environment
     model_env = os.getenv("DEFAULT_MODEL", "anthropic.claude-4.5-sonnet")
@@ -234,31 +410,12 @@ def create_agent_options() -> ClaudeAgentOptions:
     if api_base:
         sdk_env["ANTHROPIC_BASE_URL"] = api_base
 
-    # Load workflow skills (from code + markdown files)
-    all_skills = load_all_skills()
-
-    # Combine tools and skills
-    all_tools = ALL_TOOLS + all_skills
-
-    logger.info(
-        "Agent tools loaded",
-        core_tools=len(ALL_TOOLS),
-        workflow_skills=len(all_skills),
-        total=len(all_tools),
-    )
-
-    # CRITICAL: SdkMcpTools (created by @tool decorator) must be wrapped in an MCP server
-    # They cannot be passed directly to the tools parameter
-    custom_server = create_sdk_mcp_server(
-        name="book-research",
-        version="1.0.0",
-        tools=all_tools,  # All @tool decorated functions go here
-    )
-
-    # Create agent options with MCP server containing custom tools
+    # Create agent options with MCP server containing custom tools. The system
+    # prompt is sent once per SDK session, and both it and the server are
+    # built once and reused until their inputs change.
     options = ClaudeAgentOptions(
-        system_prompt=SYSTEM_PROMPT,
-        mcp_servers={"book-research": custom_server},  # MCP server goes here
+        system_prompt=get_system_prompt(),
+        mcp_servers={"book-research": get_mcp_server()},  # MCP server goes here
         allowed_tools=["mcp__book-research__*"],  # Allow all tools from this server
         model=model_name,
         permission_mode="bypassPermissions",  # Auto-approve tool use
@@ -70,8 +70,12 @@ class BookResearchChatCLI:
                 "[header]Researching...[/header]",
                 spinner="dots",
                 console=self.console,
-            ):
-                response = self.agent.run_sync(user_input)
+            ) as status:
+                # Show each agent step as it happens instead of a static spinner
+                response = self.agent.run_sync(
+                    user_input,
+                    on_progress=lambda step: status.update(f"[header]{step}[/header]"),
+                )
 
             if not response:
                 self.console.print(
@@ -1,13 +1,41 @@
 """SDK agent wrapper for CLI."""
 
 import asyncio
-from typing import Optional
-
-from claude_agent_sdk import AssistantMessage, ClaudeSDKClient, TextBlock, ToolUseBlock
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from claude_agent_sdk import (
+    AssistantMessage,
+    ClaudeAgentOptions,
+    ClaudeSDKClient,
+    TextBlock,
+    ToolUseBlock,
+)
 
 from ..agent_v2 import create_agent_options
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the CLI's event loop, using uvloop where it is installed.
+
+    The loop gets a small bounded default executor, so asyncio.to_thread()
+    calls reuse a few warm threads instead of sizing the pool per CPU.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    else:
+        loop = uvloop.new_event_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(
+            max_workers=min(8, (os.cpu_count() or 1) + 4), thread_name_prefix="agent"
+        )
+    )
+    return loop
+
+
 class AgentWrapper:
     """Wraps ClaudeSDKClient for CLI usage."""
 
@@ -19,7 +47,20 @@ class AgentWrapper:
         """
         self.console = console
         self.client: Optional[ClaudeSDKClient] = None
-        self.options = create_agent_options()
+        # Built on first use, so the CLI starts without parsing the book
+        # context or connecting to Qdrant up front
+        self._options: Optional[ClaudeAgentOptions] = None
+
+        # One loop for the whole session: the SDK client's connection is bound
+        # to the loop it was opened on, so every sync wrapper reuses it
+        self._loop = _new_event_loop()
+
+    @property
+    def options(self) -> ClaudeAgentOptions:
+        """Agent options (system prompt, tools, model), created on first access."""
+        if self._options is None:
+            self._options = create_agent_options()
+        return self._options
 
     async def connect(self):
         """Connect to Claude SDK client."""
@@ -45,14 +86,18 @@ class AgentWrapper:
             model_name: New model name
         """
         await self.disconnect()
-        # Update options with new model
-        self.options = create_agent_options()  # This will pick up env var changes
+        # Rebuild options with the new model on next use (picks up env changes)
+        self._options = None
 
-    async def query(self, user_input: str) -> str:
+    async def query(
+        self, user_input: str, on_progress: Optional[Callable[[str], None]] = None
+    ) -> str:
         """Send query to agent and get response.
 
         Args:
             user_input: User's message
+            on_progress: Called with a short status line as each agent step
+                (tool call, answer text) arrives, before the full response
 
         Returns:
             Agent's response text
@@ -72,8 +117,13 @@ class AgentWrapper:
                 for block in message.content:
                     if isinstance(block, TextBlock):
                         response_parts.append(block.text)
+                        if on_progress:
+                            on_progress("Writing response...")
                     elif isinstance(block, ToolUseBlock):
                         tool_uses.append(block.name)
+                        if on_progress:
+                            tool_name = block.name.rsplit("__", 1)[-1]
+                            on_progress(f"Running {tool_name}...")
 
         # Log tool usage (optional)
         if tool_uses:
@@ -84,23 +134,24 @@ class AgentWrapper:
 
         return "\n".join(response_parts) if response_parts else ""
 
-    def run_sync(self, user_input: str) -> str:
+    def run_sync(
+        self, user_input: str, on_progress: Optional[Callable[[str], None]] = None
+    ) -> str:
         """Synchronous wrapper for query (for CLI usage).
 
         Args:
             user_input: User's message
+            on_progress: Optional status callback (see query())
 
         Returns:
             Agent's response text
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self.query(user_input))
+        return self._loop.run_until_complete(self.query(user_input, on_progress))
 
     def reset_sync(self):
         """Synchronous wrapper for reset_conversation."""
         try:
-            loop = asyncio.get_event_loop()
-            loop.run_until_complete(self.reset_conversation())
+            self._loop.run_until_complete(self.reset_conversation())
         except RuntimeError as e:
             # Handle anyio cancel scope errors during cleanup
             if "cancel scope" in str(e):
@@ -112,8 +163,7 @@ class AgentWrapper:
     def update_model_sync(self, model_name: str):
         """Synchronous wrapper for update_model."""
         try:
-            loop = asyncio.get_event_loop()
-            loop.run_until_complete(self.update_model(model_name))
+            self._loop.run_until_complete(self.update_model(model_name))
         except RuntimeError as e:
             # Handle anyio cancel scope errors during cleanup
             if "cancel scope" in str(e):
@@ -123,10 +173,12 @@ class AgentWrapper:
                 raise
 
     def disconnect_sync(self):
-        """Synchronous wrapper for disconnect."""
+        """Synchronous wrapper for disconnect; also closes the session's loop.
+
+        The wrapper can't be used for further queries afterwards.
+        """
         try:
-            loop = asyncio.get_event_loop()
-            loop.run_until_complete(self.disconnect())
+            self._loop.run_until_complete(self.disconnect())
         except RuntimeError as e:
             # Handle anyio cancel scope errors during cleanup
             if "cancel scope" in str(e):
@@ -134,3 +186,10 @@ class AgentWrapper:
                 self.client = None
             else:
                 raise
+        finally:
+            # Release the default executor's threads and the loop itself even
+            # when the disconnect failed
+            try:
+                self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            finally:
+                self._loop.close()
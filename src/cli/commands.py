@@ -25,6 +25,18 @@ class CommandHandler:
         self.conversation_dir = Path("conversations")
         self.conversation_dir.mkdir(exist_ok=True)
 
+        # Command name -> handler(command) returning True to exit
+        self._handlers = {
+            "/exit": self._exit,
+            "/help": lambda command: self.display.print_welcome(),
+            "/new": self._new_session,
+            "/model": self._handle_model_command,
+            "/knowledge": lambda command: self._show_knowledge(),
+            "/reindex": lambda command: self._trigger_reindex(),
+            "/settings": lambda command: self._show_diagnostics(),
+            "/history": self._show_history,
+        }
+
     def handle_command(self, command: str) -> bool:
         """Handle CLI commands.
 
@@ -34,44 +46,35 @@ class CommandHandler:
         Returns:
             True if should exit, False otherwise
         """
-        command_lower = command.lower().strip()
-
-        if command_lower == "/exit":
-            self.console.print(
-                "\n[warning]Goodbye! Your conversation has been saved.[/warning]\n"
-            )
-            return True
-
-        elif command_lower == "/help":
-            self.display.print_welcome()
+        command = command.strip()
+        name = command.split(maxsplit=1)[0].lower() if command else ""
 
-        elif command_lower == "/new":
-            self.agent.reset_sync()
-            self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-            self.console.print("\n[success]Started new research session.[/success]\n")
-
-        elif command_lower.startswith("/model"):
-            self._handle_model_command(command.strip())
-
-        elif command_lower == "/knowledge":
-            self._show_knowledge()
-
-        elif command_lower == "/reindex":
-            self._trigger_reindex()
+        handler = self._handlers.get(name)
+        if handler is None:
+            self.console.print(f"\n[error]Unknown command: {command}[/error]")
+            self.console.print("Type /help for available commands.\n")
+            return False
 
-        elif command_lower == "/settings":
-            self._show_diagnostics()
+        return handler(command) is True
 
-        elif command_lower == "/history":
-            self.console.print(
-                "\n[info]Conversation history is now managed by the SDK.[/info]\n"
-            )
+    def _exit(self, command: str) -> bool:
+        """Handle /exit command."""
+        self.console.print(
+            "\n[warning]Goodbye! Your conversation has been saved.[/warning]\n"
+        )
+        return True
 
-        else:
-            self.console.print(f"\n[error]Unknown command: {command}[/error]")
-            self.console.print("Type /help for available commands.\n")
+    def _new_session(self, command: str):
+        """Handle /new command."""
+        self.agent.reset_sync()
+        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.console.print("\n[success]Started new research session.[/success]\n")
 
-        return False
+    def _show_history(self, command: str):
+        """Handle /history command."""
+        self.console.print(
+            "\n[info]Conversation history is now managed by the SDK.[/info]\n"
+        )
 
     def _handle_model_command(self, command: str):
         """Handle /model command."""
@@ -196,7 +199,7 @@ class CommandHandler:
         self.console.print("\n[bold]Qdrant Connection:[/bold]")
         if self.rag:
             try:
-                info = self.rag.vectordb.get_collection_info()
+                info = self.rag.vectordb.get_collection_info(max_age=0)
                 self.console.print("  Status: [success]CONNECTED[/success]")
                 self.console.print(f"  Points: {info['points_count']:,}")
             except Exception as e:
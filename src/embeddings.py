@@ -0,0 +1,73 @@
+"""
+Shared embedding model loader.
+
+Every VectorDBClient in a process (indexers, BookRAG, scripts) pulls its
+SentenceTransformer from here so the model is loaded into memory only once.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Serializes first loads so concurrent callers don't each build a model
+_model_lock = threading.Lock()
+
+# Loaded models by name; the cache folder only says where to find the weights,
+# so callers that pass one and callers that don't share the same instance
+_models: Dict[str, Any] = {}
+
+
+def _load_model(model_name: str, cache_folder: Optional[str]):
+    # Lazy import - SentenceTransformer loads PyTorch which takes 10+ seconds
+    from sentence_transformers import SentenceTransformer
+
+    if cache_folder:
+        logger.info(
+            f"Loading embedding model: {model_name} (from cache: {cache_folder})"
+        )
+        return SentenceTransformer(model_name, cache_folder=cache_folder)
+
+    logger.info(f"Loading embedding model: {model_name}")
+    return SentenceTransformer(model_name)
+
+
+def get_model(model_name: str, cache_folder: Optional[str] = None):
+    """
+    Get the shared SentenceTransformer for a model name (thread-safe).
+
+    Args:
+        model_name: SentenceTransformer model name
+        cache_folder: Path to local model cache (for offline operation)
+
+    Returns:
+        SentenceTransformer instance, loaded on first call
+    """
+    with _model_lock:
+        model = _models.get(model_name)
+        if model is None:
+            model = _models[model_name] = _load_model(model_name, cache_folder)
+        return model
+
+
+def encode(model, texts: List[str], batch_size: int = 32):
+    """
+    Encode texts in batches with the shared settings used by all callers.
+
+    Args:
+        model: SentenceTransformer instance from get_model()
+        texts: List of text strings
+        batch_size: Number of texts per forward pass
+
+    Returns:
+        numpy array of embeddings, one row per text
+    """
+    return model.encode(
+        texts,
+        batch_size=batch_size,
+        show_progress_bar=False,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    )
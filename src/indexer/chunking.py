@@ -9,6 +9,9 @@ import re
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
+# Blank lines (possibly containing whitespace) between paragraphs
+PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+
 
 @dataclass
 class Chunk:
@@ -102,7 +105,7 @@ class SemanticChunker:
         - List items
         """
         # Replace various paragraph separators with consistent marker
-        text = re.sub(r"\n\s*\n", "\n\n", text)
+        text = PARAGRAPH_BREAK_RE.sub("\n\n", text)
 
         # Split on double newlines
         paragraphs = text.split("\n\n")
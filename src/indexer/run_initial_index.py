@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 """Run initial indexing of Zotero and Scrivener content."""
 
-import json
+import copy
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 
 import structlog
 
+from .. import json_utils
+from ..logging_config import configure_logging
 from ..vectordb.client import VectorDBClient
 from .scrivener_indexer import ScrivenerIndexer
 from .zotero_indexer import ZoteroIndexer
@@ -14,27 +19,106 @@ from .zotero_indexer import ZoteroIndexer
 logger = structlog.get_logger()
 
 
-def load_config():
-    """Load configuration from config files."""
-    config_path = Path(__file__).parent.parent.parent / "config" / "default.json"
-    with open(config_path) as f:
-        config = json.load(f)
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_CONFIG_PATH = PROJECT_ROOT / "config" / "default.json"
+LOCAL_CONFIG_PATH = PROJECT_ROOT / "config.local.json"
 
-    # Try to load local config if it exists
-    local_config_path = Path(__file__).parent.parent.parent / "config.local.json"
-    if local_config_path.exists():
-        with open(local_config_path) as f:
-            local_config = json.load(f)
-            config.update(local_config)
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Return a file's modification time in nanoseconds, or None if missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_files(
+    default_mtime_ns: Optional[int], local_mtime_ns: Optional[int]
+) -> Dict[str, Any]:
+    """Parse and merge the config files (cached per pair of file mtimes)."""
+    config = json_utils.loads(DEFAULT_CONFIG_PATH.read_bytes())
+
+    # Merge local config if it exists
+    if local_mtime_ns is not None:
+        try:
+            config.update(json_utils.loads(LOCAL_CONFIG_PATH.read_bytes()))
+        except FileNotFoundError:
+            pass
 
     return config
 
 
-def main():
-    """Main entry point."""
-    logger.info("Starting initial indexing")
+def load_config() -> Dict[str, Any]:
+    """Load configuration from config files.
+
+    Parsed files are reused until either file's mtime changes. Each call gets
+    its own copy, so callers may modify the result freely.
+    """
+    config = _load_config_files(
+        _mtime_ns(DEFAULT_CONFIG_PATH), _mtime_ns(LOCAL_CONFIG_PATH)
+    )
+    return copy.deepcopy(config)
+
 
-    # Load config
+def index_if_empty(
+    vectordb: VectorDBClient,
+    zotero_indexer: ZoteroIndexer,
+    scrivener_indexer: ScrivenerIndexer,
+) -> bool:
+    """Index Zotero and Scrivener if the collection is empty.
+
+    Takes already-constructed components so a long-running process (the watcher
+    daemon) can run the initial index with its own warm embedding model and
+    Qdrant connection instead of bootstrapping a second process.
+
+    Args:
+        vectordb: Vector database client
+        zotero_indexer: Zotero indexer
+        scrivener_indexer: Scrivener indexer
+
+    Returns:
+        True if indexing ran, False if the collection already had content
+    """
+    # Check if already indexed
+    info = vectordb.get_collection_info(max_age=0)
+    if info["points_count"] > 0:
+        logger.info(
+            f"Collection already has {info['points_count']} points, skipping initial index"
+        )
+        return False
+
+    # Zotero (sqlite + attachments) and Scrivener (RTF files) are independent
+    # sources, so index them concurrently; they share only the vector DB client
+    logger.info("Indexing Zotero library and Scrivener project...")
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="index") as pool:
+        futures = {
+            "Zotero": pool.submit(zotero_indexer.index_all),
+            "Scrivener": pool.submit(scrivener_indexer.index_all),
+        }
+
+        for source, future in futures.items():
+            try:
+                stats = future.result()
+                logger.info(f"{source} indexing complete: {stats}")
+            except Exception as e:
+                logger.error(f"{source} indexing failed: {e}")
+
+    logger.info("Initial indexing complete")
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def get_components() -> Tuple[VectorDBClient, ZoteroIndexer, ScrivenerIndexer]:
+    """Build the vector DB client and both indexers once per process.
+
+    The initial indexer and the watcher daemon both start from here, so
+    config parsing, the Qdrant connection and indexer setup happen once even
+    when one entry point hands off to the other.
+
+    Returns:
+        Tuple of (vectordb, zotero_indexer, scrivener_indexer)
+    """
     config = load_config()
 
     # Get paths from environment
@@ -57,28 +141,9 @@ def main():
         vector_size=config["embedding"]["vector_size"],
     )
 
-    # Check if already indexed
-    info = vectordb.get_collection_info()
-    if info["points_count"] > 0:
-        logger.info(
-            f"Collection already has {info['points_count']} points, skipping initial index"
-        )
-        return
-
-    # Index Zotero
-    logger.info("Indexing Zotero library...")
     zotero_indexer = ZoteroIndexer(
         zotero_path=zotero_path, vectordb=vectordb, config=config
     )
-
-    try:
-        zotero_count = zotero_indexer.index_all()
-        logger.info(f"Indexed {zotero_count} Zotero chunks")
-    except Exception as e:
-        logger.error(f"Zotero indexing failed: {e}")
-
-    # Index Scrivener
-    logger.info("Indexing Scrivener project...")
     scrivener_indexer = ScrivenerIndexer(
         scrivener_path=scrivener_path,
         vectordb=vectordb,
@@ -86,13 +151,15 @@ def main():
         manuscript_folder=scrivener_manuscript_folder or None,
     )
 
-    try:
-        scrivener_count = scrivener_indexer.index_all()
-        logger.info(f"Indexed {scrivener_count} Scrivener chunks")
-    except Exception as e:
-        logger.error(f"Scrivener indexing failed: {e}")
+    return vectordb, zotero_indexer, scrivener_indexer
 
-    logger.info("Initial indexing complete")
+
+def main():
+    """Main entry point."""
+    configure_logging()
+    logger.info("Starting initial indexing")
+
+    index_if_empty(*get_components())
 
 
 if __name__ == "__main__":
@@ -5,9 +5,11 @@ Parses .scriv bundle structure and indexes documents for semantic search.
 """
 
 import hashlib
+import re
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import structlog
 from striprtf.striprtf import rtf_to_text
@@ -18,6 +20,14 @@ from .chunking import ScrivenerChunker
 
 logger = structlog.get_logger()
 
+# Document-type heuristics run on every indexed document
+BULLET_RE = re.compile(r"^\s*[-*•]\s+|^\s*\d+[\.)]\s+")
+URL_RE = re.compile(r"https?://|www\.|\.com|\.org|\.edu|\.gov", re.IGNORECASE)
+
+# Fallback chapter detection for documents outside the .scrivx mapping
+PATH_CHAPTER_RE = re.compile(r"chapter[_\s-]?(\d+)", re.IGNORECASE)
+HEADING_CHAPTER_RE = re.compile(r"chapter\s+(\d+)", re.IGNORECASE)
+
 
 class ScrivenerIndexer:
     """Index Scrivener project documents"""
@@ -251,13 +261,55 @@ class ScrivenerIndexer:
         """
         return hashlib.md5(text.encode("utf-8")).hexdigest()
 
+    def index_paths(self, paths: Iterable[Path]) -> int:
+        """
+        Re-index a batch of Scrivener documents in one pass.
+
+        Duplicate paths are coalesced, and the chunks of every document are
+        embedded and upserted together instead of one document at a time.
+
+        Args:
+            paths: RTF document paths (duplicates allowed)
+
+        Returns:
+            Number of chunks indexed
+        """
+        unique_paths = list(dict.fromkeys(Path(p) for p in paths))
+        chunk_dicts = []
+        for rtf_path in unique_paths:
+            chunk_dicts.extend(self._build_document_chunks(rtf_path))
+
+        try:
+            return self.vectordb.index_chunks(chunk_dicts)
+        except Exception as embed_error:
+            # Isolate the failing document(s) by falling back to one at a time
+            logger.warning(
+                f"Batch re-index of {len(unique_paths)} documents failed "
+                f"({embed_error}), retrying individually"
+            )
+            return sum(self._index_document(rtf_path) for rtf_path in unique_paths)
+
     def _index_document(self, rtf_path: Path) -> int:
         """Index a single Scrivener document"""
+        chunk_dicts = self._build_document_chunks(rtf_path)
+
+        # Index with error handling for embedding issues
+        try:
+            return self.vectordb.index_chunks(chunk_dicts)
+        except Exception as embed_error:
+            # Encoding/embedding errors - skip this document
+            logger.warning(
+                f"Skipping {rtf_path.name} due to embedding error: {embed_error}"
+            )
+            return 0
+
+    def _build_document_chunks(self, rtf_path: Path) -> List[Dict[str, Any]]:
+        """Read and chunk a single Scrivener document for indexing"""
         try:
             text = self._read_rtf(rtf_path)
 
             if not text.strip():
-                return 0
+                return []
 
             # Determine document type
             doc_type = self._determine_doc_type(rtf_path, text)
@@ -271,7 +323,7 @@ class ScrivenerIndexer:
 
             # If manuscript_folder is set and this UUID isn't in our mapping, skip it
             if self.manuscript_folder and scrivener_uuid not in self.uuid_to_chapter:
-                return 0
+                return []
 
             # Get file stats for change tracking
             file_stat = rtf_path.stat()
@@ -294,11 +346,13 @@ class ScrivenerIndexer:
             if scrivener_uuid in self.uuid_to_chapter:
                 chapter_info = self.uuid_to_chapter[scrivener_uuid]
                 # Use "is not None" because chapter_number can be 0 (Preface)
-                if chapter_info.get("chapter_number") is not None:
-                    metadata["chapter_number"] = chapter_info["chapter_number"]
+                chapter_number = chapter_info.get("chapter_number")
+                if chapter_number is not None:
+                    metadata["chapter_number"] = chapter_number
                     metadata["chapter_title"] = chapter_info.get("chapter_title", "")
-                if chapter_info.get("parent"):
-                    metadata["parent_title"] = chapter_info["parent"]
+                parent = chapter_info.get("parent")
+                if parent:
+                    metadata["parent_title"] = parent
             else:
                 # Fallback: try to extract chapter number from path or content
                 chapter_num = self._extract_chapter_number(rtf_path, text)
@@ -314,23 +368,13 @@ class ScrivenerIndexer:
             )
 
             # Convert to format expected by vectordb
-            chunk_dicts = [
+            return [
                 {"text": chunk.text, "metadata": chunk.metadata} for chunk in chunks
             ]
 
-            # Index with error handling for embedding issues
-            try:
-                return self.vectordb.index_chunks(chunk_dicts)
-            except Exception as embed_error:
-                # Encoding/embedding errors - skip this document
-                logger.warning(
-                    f"Skipping {rtf_path.name} due to embedding error: {embed_error}"
-                )
-                return 0
-
         except Exception as e:
             logger.error(f"Failed to process {rtf_path}: {e}")
-            return 0
+            return []
 
     def _determine_doc_type(self, path: Path, text: str) -> str:
         """Determine document type based on text structure.
@@ -349,7 +393,6 @@ class ScrivenerIndexer:
             return "notes"
 
         # Calculate text structure metrics
-        total_chars = len(text.strip())
         avg_line_length = sum(len(line) for line in lines) / len(lines)
         avg_para_length = (
             sum(len(p) for p in paragraphs) / len(paragraphs) if paragraphs else 0
@@ -368,17 +411,14 @@ class ScrivenerIndexer:
             fragment_indicators += 1
 
         # 3. Bullet point indicators (-, *, •, numbers)
-        bullet_pattern = r"^\s*[-*•]\s+|^\s*\d+[\.)]\s+"
-        import re
-
-        bullet_lines = sum(1 for line in lines if re.match(bullet_pattern, line))
+        bullet_match = BULLET_RE.match
+        bullet_lines = sum(1 for line in lines if bullet_match(line))
         if bullet_lines / len(lines) > 0.2:  # More than 20% bullets
             fragment_indicators += 1
 
-        # 4. URLs present (research/reference material)
-        url_pattern = r"https?://|www\.|\.com|\.org|\.edu|\.gov"
-        url_matches = re.findall(url_pattern, text, re.IGNORECASE)
-        if len(url_matches) >= 3:  # 3+ URLs suggests notes/references
+        # 4. URLs present (research/reference material); stop at the third
+        url_matches = sum(1 for _ in islice(URL_RE.finditer(text), 3))
+        if url_matches >= 3:  # 3+ URLs suggests notes/references
             fragment_indicators += 1
 
         # 5. Very short paragraphs (avg < 100 chars suggests notes)
@@ -397,17 +437,15 @@ class ScrivenerIndexer:
 
     def _extract_chapter_number(self, path: Path, text: str) -> Optional[int]:
         """Try to extract chapter number from path or content"""
-        import re
-
         # Try path first
-        path_match = re.search(r"chapter[_\s-]?(\d+)", str(path), re.IGNORECASE)
+        path_match = PATH_CHAPTER_RE.search(str(path))
         if path_match:
             return int(path_match.group(1))
 
         # Try document title/heading
-        lines = text.split("\n")[:5]  # Check first 5 lines
+        lines = text.split("\n", 5)[:5]  # Check first 5 lines
         for line in lines:
-            title_match = re.search(r"chapter\s+(\d+)", line, re.IGNORECASE)
+            title_match = HEADING_CHAPTER_RE.search(line)
             if title_match:
                 return int(title_match.group(1))
 
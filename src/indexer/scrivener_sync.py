@@ -298,37 +298,29 @@ class ScrivenerSyncDetector:
                     f"Failed to delete {change.scrivener_id}: {e}", exc_info=True
                 )
 
-        # Apply moves (delete old + re-index with new chapter)
+        # Apply moves (delete old chunks; re-indexed below with new chapter)
+        moved_ids = set()
         for change in changes.moved:
             try:
-                # Delete old chunks
                 self.vectordb.delete_by_scrivener_id(change.scrivener_id)
-                # Re-index with new chapter metadata
-                self.indexer._index_document(Path(change.file_path))
-                stats["moved_updated"] += 1
+                moved_ids.add(change.scrivener_id)
             except Exception as e:
                 logger.error(
                     f"Failed to move {change.scrivener_id}: {e}", exc_info=True
                 )
 
-        # Apply modifications (re-index)
-        for change in changes.modified:
+        # Re-index moved, modified and new documents as one coalesced batch
+        reindex = [c for c in changes.moved if c.scrivener_id in moved_ids]
+        reindex += changes.modified + changes.new
+        if reindex:
             try:
-                self.indexer._index_document(Path(change.file_path))
-                stats["modified_indexed"] += 1
+                self.indexer.index_paths(Path(c.file_path) for c in reindex)
+                stats["moved_updated"] += len(moved_ids)
+                stats["modified_indexed"] += len(changes.modified)
+                stats["new_indexed"] += len(changes.new)
             except Exception as e:
                 logger.error(
-                    f"Failed to re-index {change.scrivener_id}: {e}", exc_info=True
-                )
-
-        # Apply new documents (index)
-        for change in changes.new:
-            try:
-                self.indexer._index_document(Path(change.file_path))
-                stats["new_indexed"] += 1
-            except Exception as e:
-                logger.error(
-                    f"Failed to index new {change.scrivener_id}: {e}", exc_info=True
+                    f"Failed to re-index {len(reindex)} documents: {e}", exc_info=True
                 )
 
         logger.info(
@@ -61,6 +61,7 @@ class ZoteroIndexer:
             .get("zotero", {})
             .get("chapter_pattern", r"^(\d+)\.")
         )
+        self._chapter_re = re.compile(self.chapter_pattern)
         self.exclude_collections = (
             config.get("project", {}).get("zotero", {}).get("exclude_collections", [])
         )
@@ -295,11 +296,12 @@ class ZoteroIndexer:
             )
 
             if attachment_path and attachment_path.exists():
-                if attachment_path.suffix.lower() == ".pdf":
+                suffix = attachment_path.suffix.lower()
+                if suffix == ".pdf":
                     return self._index_pdf(attachment_path, metadata)
-                elif attachment_path.suffix.lower() in [".html", ".htm"]:
+                elif suffix in (".html", ".htm"):
                     return self._index_html(attachment_path, metadata)
-                elif attachment_path.suffix.lower() == ".txt":
+                elif suffix == ".txt":
                     return self._index_text(attachment_path, metadata)
             else:
                 logger.warning(
@@ -419,7 +421,7 @@ class ZoteroIndexer:
 
     def _extract_chapter_number(self, collection_name: str) -> Optional[int]:
         """Extract chapter number from collection name"""
-        match = re.match(self.chapter_pattern, collection_name)
+        match = self._chapter_re.match(collection_name)
         if match:
             try:
                 return int(match.group(1))
@@ -0,0 +1,64 @@
+"""
+JSON encode/decode helpers.
+
+Uses orjson when it is installed and falls back to the standard library json
+module otherwise, so minimal environments still work.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to JSON text.
+
+    Args:
+        obj: JSON-serializable object (non-string dict keys are allowed)
+        indent: Indent with two spaces for readability
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def dumps_canonical(obj: Any) -> bytes:
+    """
+    Serialize an object to compact JSON bytes with sorted keys, for hashing.
+
+    Values JSON cannot represent are converted with str().
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(
+        obj, sort_keys=True, default=str, ensure_ascii=False, separators=(",", ":")
+    ).encode()
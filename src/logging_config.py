@@ -0,0 +1,58 @@
+"""
+Process-wide structlog configuration.
+
+Entry points call configure_logging() once at startup. Records below
+LOG_LEVEL are dropped by the bound logger before any processor runs, and
+LOG_FORMAT=json switches the human-readable console renderer for a JSON
+renderer suited to container logs.
+"""
+
+import logging
+import os
+from typing import Optional
+
+import structlog
+
+from .json_utils import orjson
+
+
+def configure_logging(level: Optional[str] = None, fmt: Optional[str] = None) -> None:
+    """
+    Configure structlog for the current process.
+
+    Args:
+        level: Minimum log level name (defaults to LOG_LEVEL env variable, INFO)
+        fmt: "console" or "json" (defaults to LOG_FORMAT env variable, console)
+    """
+    level_name = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+    fmt = (fmt or os.getenv("LOG_FORMAT", "console")).lower()
+
+    processors = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=fmt == "json"),
+    ]
+    if fmt == "json" and orjson is not None:
+        processors += [
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
+        ]
+        logger_factory = structlog.BytesLoggerFactory()
+    elif fmt == "json":
+        processors += [
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(),
+        ]
+        logger_factory = structlog.PrintLoggerFactory()
+    else:
+        processors.append(structlog.dev.ConsoleRenderer())
+        logger_factory = structlog.PrintLoggerFactory()
+
+    structlog.configure(
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelNamesMapping().get(level_name, logging.INFO)
+        ),
+        logger_factory=logger_factory,
+        cache_logger_on_first_use=True,
+    )
@@ -1,43 +1,177 @@
 """RAG module for book research using Qdrant."""
 
 import os
-import re
 import sqlite3
+from collections import Counter, defaultdict
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
 
 from .scrivener_parser import ScrivenerParser
+from .semantic_cache import SemanticCache
+from .skills.fact_extractor import FactExtractor
+from .sync_checker import OUTLINE_CHAPTER_RE, TITLE_SUFFIX_RE
 from .vectordb.client import VectorDBClient
 
 logger = structlog.get_logger()
 
+# Chunks read from a chapter to build its centroid in suggest_related_research
+RELATED_RESEARCH_SAMPLE_SIZE = 50
+
+
+def _format_context_entry(result: Dict[str, Any]) -> str:
+    """Format one search hit as a context entry for get_context()."""
+    meta = result["metadata"]
+    source_info = f"**Source:** {meta.get('title', 'Unknown')}"
+    chapter = meta.get("chapter_number")
+    if chapter:
+        source_info = f"{source_info} (Chapter {chapter})"
+    page = meta.get("page")
+    if page:
+        source_info = f"{source_info}, Page {page}"
+    return (
+        f"{source_info}\n"
+        f"**Relevance:** {result['score']:.0%}\n\n"
+        f"{result['text']}\n\n"
+        "---\n"
+    )
+
+
+def _summary_overview(data: Dict[str, Any]) -> List[str]:
+    """Overview section of export_chapter_summary()."""
+    info = data["info"]
+    lines = ["## Overview", f"- Total indexed chunks: {info.get('indexed_chunks', 0)}"]
+
+    zotero = info.get("zotero", {})
+    if zotero:
+        lines.append(
+            f"- Zotero sources: {zotero.get('source_count', 0)} "
+            f"({zotero.get('chunk_count', 0)} chunks)"
+        )
+
+    scrivener = info.get("scrivener", {})
+    if scrivener:
+        lines.append(f"- Draft status: ~{scrivener.get('estimated_words', 0)} words")
+
+    lines.append("")
+    return lines
+
+
+def _summary_diversity(data: Dict[str, Any]) -> List[str]:
+    """Source diversity section of export_chapter_summary()."""
+    diversity = data["diversity"]
+    lines = [
+        "## Source Diversity",
+        f"- Diversity score: {diversity.get('diversity_score', 0):.2f} "
+        "(0=homogeneous, 1=diverse)",
+        f"- Total unique sources: {diversity.get('total_sources', 0)}",
+    ]
+
+    source_types = diversity.get("source_types", {})
+    if source_types:
+        lines.append("- Source types:")
+        # analyze_source_diversity() returns types most common first
+        lines.extend(
+            f"  - {item_type}: {count}" for item_type, count in source_types.items()
+        )
+
+    lines.append("")
+    return lines
+
+
+def _summary_key_sources(data: Dict[str, Any]) -> List[str]:
+    """Key sources section of export_chapter_summary()."""
+    key_sources = data["key_sources"]
+    lines = ["## Key Sources"]
+    key_srcs = key_sources.get("key_sources", [])
+    if key_srcs:
+        threshold = key_sources.get("threshold", 3)
+        lines.append(f"Found {len(key_srcs)} sources with {threshold}+ mentions:")
+        lines.extend(
+            f"- **{src['title']}** ({src['item_type']}): {src['chunk_count']} chunks"
+            for src in islice(key_srcs, 10)  # Top 10
+        )
+    else:
+        lines.append("No key sources identified.")
+
+    lines.append("")
+    return lines
+
+
+def _summary_most_cited(data: Dict[str, Any]) -> List[str]:
+    """Most cited sources section of export_chapter_summary() (empty if none)."""
+    most_cited = data["diversity"].get("most_cited", [])
+    if not most_cited:
+        return []
+    lines = ["## Most Cited Sources"]
+    lines.extend(f"- {src['title']}: {src['chunks']} chunks" for src in most_cited)
+    return lines
+
+
+# Section builders for export_chapter_summary(), in output order
+SUMMARY_SECTIONS = (
+    _summary_overview,
+    _summary_diversity,
+    _summary_key_sources,
+    _summary_most_cited,
+)
+
 
 class BookRAG:
     """RAG system for book research using Qdrant vector database."""
 
-    def __init__(self, qdrant_url: Optional[str] = None):
+    def __init__(
+        self,
+        qdrant_url: Optional[str] = None,
+        vectordb: Optional[VectorDBClient] = None,
+    ):
         """Initialize BookRAG system.
 
         Args:
             qdrant_url: URL to Qdrant server (defaults to env variable)
+            vectordb: Existing client to share (e.g. the indexers' client, so
+                one process keeps one connection and embedding model)
         """
         self.qdrant_url = qdrant_url or os.getenv("QDRANT_URL", "http://localhost:6333")
 
         # Initialize vector DB client
-        self.vectordb = VectorDBClient(
+        self.vectordb = vectordb or VectorDBClient(
             qdrant_url=self.qdrant_url,
             collection_name="book_research",
             embedding_model="all-MiniLM-L6-v2",
             vector_size=384,
+            model_cache_dir=os.getenv("MODEL_CACHE_DIR"),
         )
 
         # Zotero database path
         self.zotero_path = os.getenv("ZOTERO_PATH", "/Users/anthonytownsend/Zotero")
         self.zotero_db = Path(self.zotero_path) / "zotero.sqlite"
 
+        # Reuses results for repeated or paraphrased queries within a session
+        self._search_cache = SemanticCache()
+
+        # Fallback extraction for chunks indexed before facts were stored
+        self._fact_extractor = FactExtractor()
+
+    def _search_scope(
+        self, filters: Optional[Dict[str, Any]], limit: int, score_threshold: float
+    ) -> Tuple:
+        """Build the search cache scope for a set of search parameters.
+
+        The scope includes the last-indexed timestamps, so results cached
+        before a re-index are never served after it.
+        """
+        generation = tuple(sorted(self.vectordb.get_index_timestamps().items()))
+        return (
+            repr(sorted((filters or {}).items())),
+            limit,
+            score_threshold,
+            generation,
+        )
+
     def search(
         self,
         query: str,
@@ -57,9 +191,91 @@ class BookRAG:
         Returns:
             List of search results with text, score, and metadata
         """
-        return self.vectordb.search(
-            query=query, filters=filters, limit=limit, score_threshold=score_threshold
+        # Empty queries are metadata listings; no embedding or cache needed
+        if not query:
+            return self.vectordb.search(
+                query="", filters=filters, limit=limit, score_threshold=score_threshold
+            )
+
+        scope = self._search_scope(filters, limit, score_threshold)
+        cached = self._search_cache.get_exact(scope, query)
+        if cached is not None:
+            return list(cached)
+
+        # Embed once; the vector serves both the cache lookup and the search
+        query_embedding = self.vectordb.embed_query(query)
+        cached = self._search_cache.get_similar(scope, query_embedding)
+        if cached is not None:
+            return list(cached)
+
+        results = self.vectordb.search_by_vector(
+            query_embedding,
+            filters=filters,
+            limit=limit,
+            score_threshold=score_threshold,
         )
+        self._search_cache.put(scope, query, query_embedding, results)
+        return list(results)
+
+    def search_batch(
+        self,
+        queries: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 20,
+        score_threshold: float = 0.7,
+    ) -> List[List[Dict[str, Any]]]:
+        """Run several semantic searches with shared embedding and Qdrant calls.
+
+        Cached queries are answered from the search cache; the rest are
+        embedded in one pass and sent to Qdrant as a single batch request.
+
+        Args:
+            queries: Search query texts
+            filters: Optional filters applied to every query
+            limit: Maximum number of results per query
+            score_threshold: Minimum similarity score (0-1)
+
+        Returns:
+            One result list per query, in the same order as queries
+        """
+        scope = self._search_scope(filters, limit, score_threshold)
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(queries)
+
+        pending = []
+        for i, query in enumerate(queries):
+            if not query:
+                results[i] = self.search(
+                    query, filters=filters, limit=limit, score_threshold=score_threshold
+                )
+                continue
+            cached = self._search_cache.get_exact(scope, query)
+            if cached is not None:
+                results[i] = list(cached)
+            else:
+                pending.append(i)
+
+        if pending:
+            embeddings = self.vectordb.embed_texts([queries[i] for i in pending])
+
+            misses = []
+            for i, embedding in zip(pending, embeddings):
+                cached = self._search_cache.get_similar(scope, embedding)
+                if cached is not None:
+                    results[i] = list(cached)
+                else:
+                    misses.append((i, embedding))
+
+            batch = self.vectordb.search_batch_by_vectors(
+                [embedding for _, embedding in misses],
+                filters=filters,
+                limit=limit,
+                score_threshold=score_threshold,
+            )
+            for (i, embedding), hits in zip(misses, batch):
+                self._search_cache.put(scope, queries[i], embedding, hits)
+                results[i] = list(hits)
+
+        return results
 
     def get_context_for_query(
         self, query: str, chapter: Optional[int] = None, n_results: int = 10
@@ -82,24 +298,9 @@ class BookRAG:
         if not results:
             return ""
 
-        # Format as context
+        # Format as context: one string per result, joined once
         context_parts = ["## Relevant Information from Your Research\n"]
-
-        for r in results:
-            meta = r["metadata"]
-            source_info = f"**Source:** {meta.get('title', 'Unknown')}"
-            if meta.get("chapter_number"):
-                source_info += f" (Chapter {meta['chapter_number']})"
-            if meta.get("page"):
-                source_info += f", Page {meta['page']}"
-
-            context_parts.append(
-                f"{source_info}\n"
-                f"**Relevance:** {r['score']:.0%}\n\n"
-                f"{r['text']}\n\n"
-                f"---\n"
-            )
-
+        context_parts.extend(_format_context_entry(r) for r in results)
         return "\n".join(context_parts)
 
     def get_annotations(self, chapter: Optional[int] = None) -> Dict[str, Any]:
@@ -249,7 +450,7 @@ class BookRAG:
         if chapters:
             for chapter_num in chapters:
                 results = self.search(
-                    query="chapter content",
+                    query="",
                     filters={"chapter_number": chapter_num},
                     limit=1000,
                     score_threshold=0.0,
@@ -278,6 +479,93 @@ class BookRAG:
             query=text, filters=None, limit=limit, score_threshold=threshold
         )
 
+    def find_facts(
+        self,
+        topic: str,
+        chapter: Optional[int] = None,
+        fact_type: Optional[str] = None,
+        limit: int = 20,
+    ) -> Dict[str, Any]:
+        """Find statistics, quotes, definitions, and examples about a topic.
+
+        Facts are extracted at indexing time and stored in the chunk payload,
+        so this filters on the indexed fact_types field and reads the stored
+        facts instead of running extraction on each result. Chunks indexed
+        before facts were stored have no fact payload; for those, facts are
+        extracted on the fly and the result carries a re-index note.
+
+        Args:
+            topic: Topic to search for
+            chapter: Optional chapter number to filter by
+            fact_type: Optional fact type (statistic, quote, definition,
+                case_study); None returns all types
+            limit: Maximum number of facts to return
+
+        Returns:
+            Dict with matching facts and their sources
+        """
+        filters = {"fact_types": fact_type} if fact_type else {"has_facts": True}
+        if chapter:
+            filters["chapter_number"] = chapter
+
+        results = self.search(
+            query=topic, filters=filters, limit=50, score_threshold=0.5
+        )
+        if not results:
+            # Nothing tagged with facts: the index may predate fact tagging,
+            # so search the Zotero chunks themselves
+            filters = {"source_type": "zotero"}
+            if chapter:
+                filters["chapter_number"] = chapter
+            results = self.search(
+                query=topic, filters=filters, limit=50, score_threshold=0.5
+            )
+
+        wanted = [fact_type] if fact_type else None
+        extracted_on_the_fly = False
+        facts = []
+        for result in results:
+            meta = result["metadata"]
+            chunk_facts = meta.get("facts")
+            if chunk_facts is None:
+                chunk_facts = self._fact_extractor.compact_facts(
+                    self._fact_extractor.extract_facts(
+                        result["text"], {}, fact_types=wanted
+                    )
+                )
+                extracted_on_the_fly = extracted_on_the_fly or bool(chunk_facts)
+            for fact in chunk_facts:
+                if fact_type and fact["type"] != fact_type:
+                    continue
+                facts.append(
+                    {
+                        **fact,
+                        "source": meta.get("title", "Unknown"),
+                        "chapter": meta.get("chapter_number"),
+                        "score": result["score"],
+                    }
+                )
+                if len(facts) >= limit:
+                    break
+            if len(facts) >= limit:
+                break
+
+        response = {
+            "topic": topic,
+            "chapter": chapter,
+            "fact_type": fact_type,
+            "fact_count": len(facts),
+            "facts": facts,
+        }
+        if extracted_on_the_fly:
+            logger.warning("find_facts: Zotero index has no stored facts")
+            response["note"] = (
+                "Some sources were indexed before facts were stored, so their "
+                "facts were extracted at query time. Run "
+                "`scripts/reindex.py --source zotero --force` to store them."
+            )
+        return response
+
     def get_index_stats(self) -> Dict[str, Any]:
         """Get statistics about indexed data including freshness.
 
@@ -328,11 +616,25 @@ class BookRAG:
             "raw_timestamps": timestamps,
         }
 
-    def get_chapter_info(self, chapter_number: int) -> Dict[str, Any]:
+    def _get_chapter_chunks(self, chapter: int) -> List[Dict[str, Any]]:
+        """Fetch all indexed chunks (Zotero and Scrivener) for a chapter."""
+        return self.search(
+            query="",
+            filters={"chapter_number": chapter},
+            limit=1000,
+            score_threshold=0.0,
+        )
+
+    def get_chapter_info(
+        self,
+        chapter_number: int,
+        chapter_chunks: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
         """Get comprehensive information about a chapter.
 
         Args:
             chapter_number: Chapter number
+            chapter_chunks: Pre-fetched chapter chunks (avoids another query)
 
         Returns:
             Dict with chapter metadata, source counts, and content stats
@@ -345,12 +647,9 @@ class BookRAG:
         }
 
         # Get indexed chunk count
-        results = self.search(
-            query="chapter content",
-            filters={"chapter_number": chapter_number},
-            limit=1000,
-            score_threshold=0.0,
-        )
+        if chapter_chunks is None:
+            chapter_chunks = self._get_chapter_chunks(chapter_number)
+        results = chapter_chunks
         info["indexed_chunks"] = len(results)
 
         # Get Zotero info from indexed data
@@ -367,7 +666,7 @@ class BookRAG:
             info["zotero"] = {
                 "source_count": len(sources),
                 "chunk_count": len(zotero_results),
-                "sources": list(sources)[:10],  # Limit to 10 for display
+                "sources": list(islice(sources, 10)),  # Limit to 10 for display
             }
 
         # Get Scrivener info from indexed data
@@ -389,27 +688,22 @@ class BookRAG:
         Returns:
             Dict with sync status, mismatches, and recommendations
         """
-        # Get chapters from outline.txt
         outline_chapters = self._extract_chapters_from_outline()
-
-        # Get chapters from indexed data
         zotero_chapters = self._get_indexed_chapters("zotero")
         scrivener_chapters = self._get_indexed_chapters("scrivener")
 
-        # Find mismatches
-        all_chapters = (
-            set(outline_chapters.keys())
-            | set(zotero_chapters.keys())
-            | set(scrivener_chapters.keys())
-        )
-        mismatches = []
+        # Classify mismatches once with set operations
+        in_outline = set(outline_chapters)
+        in_zotero = set(zotero_chapters)
+        in_scrivener = set(scrivener_chapters)
 
-        for chapter_num in sorted(all_chapters):
-            in_outline = chapter_num in outline_chapters
-            in_zotero = chapter_num in zotero_chapters
-            in_scrivener = chapter_num in scrivener_chapters
+        missing_zotero = in_scrivener - in_zotero
+        missing_outline = (in_scrivener & in_zotero) - in_outline
+        missing_scrivener = (in_zotero | in_outline) - in_scrivener
 
-            if in_scrivener and not in_zotero:
+        mismatches = []
+        for chapter_num in sorted(missing_zotero | missing_outline | missing_scrivener):
+            if chapter_num in missing_zotero:
                 mismatches.append(
                     {
                         "chapter": chapter_num,
@@ -421,7 +715,7 @@ class BookRAG:
                         ),
                     }
                 )
-            elif in_scrivener and not in_outline:
+            elif chapter_num in missing_outline:
                 mismatches.append(
                     {
                         "chapter": chapter_num,
@@ -433,7 +727,7 @@ class BookRAG:
                         ),
                     }
                 )
-            elif not in_scrivener and (in_zotero or in_outline):
+            else:
                 mismatches.append(
                     {
                         "chapter": chapter_num,
@@ -448,26 +742,18 @@ class BookRAG:
 
         # Generate recommendations
         recommendations = []
-        if any(m["type"] == "missing_from_zotero" for m in mismatches):
-            chapters_list = [
-                str(m["chapter"])
-                for m in mismatches
-                if m["type"] == "missing_from_zotero"
-            ]
+        if missing_zotero:
+            chapters_list = [str(ch) for ch in sorted(missing_zotero)]
             recommendations.append(
                 f"Create Zotero collections for chapters: {', '.join(chapters_list)}"
             )
-        if any(m["type"] == "missing_from_outline" for m in mismatches):
+        if missing_outline:
             recommendations.append(
                 "Update data/outline.txt to match your current "
                 "Scrivener chapter structure"
             )
-        if any(m["type"] == "missing_from_scrivener" for m in mismatches):
-            chapters_list = [
-                str(m["chapter"])
-                for m in mismatches
-                if m["type"] == "missing_from_scrivener"
-            ]
+        if missing_scrivener:
+            chapters_list = [str(ch) for ch in sorted(missing_scrivener)]
             recommendations.append(
                 f"Chapters {', '.join(chapters_list)} may have been "
                 "removed or renumbered in Scrivener. "
@@ -525,20 +811,13 @@ class BookRAG:
         content = outline_path.read_text()
         chapters = {}
 
-        patterns = [
-            r"[Cc]hapter\s+(\d+)[:\.]?\s*[:-]?\s*(.+)",
-            r"^\s*(\d+)\.\s+(.+)",
-        ]
-
         for line in content.split("\n"):
-            for pattern in patterns:
-                match = re.search(pattern, line)
-                if match:
-                    num = int(match.group(1))
-                    title = match.group(2).strip()
-                    title = re.sub(r"\s*-\s*.+$", "", title).strip()
-                    chapters[num] = title
-                    break
+            match = OUTLINE_CHAPTER_RE.match(line)
+            if match:
+                num = int(match["num"] or match["list_num"])
+                title = (match["title"] or match["list_title"]).strip()
+                title = TITLE_SUFFIX_RE.sub("", title).strip()
+                chapters[num] = title
 
         return chapters
 
@@ -547,7 +826,7 @@ class BookRAG:
         try:
             # Query all indexed data for this source type
             results = self.search(
-                query="chapter content",
+                query="",
                 filters={"source_type": source_type},
                 limit=1000,
                 score_threshold=0.0,
@@ -575,13 +854,19 @@ class BookRAG:
     # ========================================================================
 
     def find_cross_chapter_themes(
-        self, keyword: str, min_chapters: int = 2
+        self, keyword: str, min_chapters: int = 2, max_mentions: int = 10
     ) -> Dict[str, Any]:
         """Track a theme or concept across multiple chapters.
 
+        Each chapter lists at most max_mentions excerpts. They are the first
+        max_mentions of that chapter's search results, which search() returns
+        sorted by descending score, so they are its highest-scoring matches.
+        total_mentions still counts every match, including excerpts past the cap.
+
         Args:
             keyword: Theme, concept, or search term to track
             min_chapters: Minimum number of chapters theme must appear in
+            max_mentions: Maximum excerpts returned per chapter
 
         Returns:
             Dict with chapters containing the theme and relevant excerpts
@@ -589,22 +874,24 @@ class BookRAG:
         # Search for the keyword across all chapters
         results = self.search(query=keyword, limit=100, score_threshold=0.6)
 
-        # Group results by chapter
-        chapters_dict = {}
+        # Group results by chapter in one pass. Results arrive sorted by score,
+        # so the first max_mentions per chapter are its top excerpts and the
+        # rest only need counting.
+        by_chapter = defaultdict(lambda: {"count": 0, "mentions": []})
+        titles = {}
         for result in results:
             meta = result["metadata"]
             chapter_num = meta.get("chapter_number")
             if not chapter_num:
                 continue
 
-            if chapter_num not in chapters_dict:
-                chapters_dict[chapter_num] = {
-                    "chapter_number": chapter_num,
-                    "chapter_title": meta.get("chapter_title", "Unknown"),
-                    "mentions": [],
-                }
+            titles.setdefault(chapter_num, meta.get("chapter_title", "Unknown"))
+            entry = by_chapter[chapter_num]
+            entry["count"] += 1
+            if len(entry["mentions"]) >= max_mentions:
+                continue
 
-            chapters_dict[chapter_num]["mentions"].append(
+            entry["mentions"].append(
                 {
                     "text": result["text"][:300],
                     "score": result["score"],
@@ -613,33 +900,47 @@ class BookRAG:
                 }
             )
 
-        # Filter by minimum chapters threshold
         matching_chapters = [
-            ch for ch in chapters_dict.values() if len(ch["mentions"]) > 0
+            {
+                "chapter_number": chapter_num,
+                "chapter_title": titles[chapter_num],
+                "mentions": entry["mentions"],
+            }
+            for chapter_num, entry in sorted(by_chapter.items())
         ]
-        matching_chapters.sort(key=lambda x: x["chapter_number"])
 
         return {
             "keyword": keyword,
             "total_chapters": len(matching_chapters),
-            "total_mentions": sum(len(ch["mentions"]) for ch in matching_chapters),
+            "total_mentions": sum(e["count"] for e in by_chapter.values()),
             "meets_threshold": len(matching_chapters) >= min_chapters,
             "chapters": matching_chapters,
         }
 
-    def compare_chapters(self, chapter1: int, chapter2: int) -> Dict[str, Any]:
+    def compare_chapters(
+        self,
+        chapter1: int,
+        chapter2: int,
+        chapter_infos: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
         """Compare research density and coverage between two chapters.
 
         Args:
             chapter1: First chapter number
             chapter2: Second chapter number
+            chapter_infos: Pre-fetched get_chapter_info() results for both
+                chapters (lets callers fetch them concurrently)
 
         Returns:
             Dict with comparison metrics
         """
         # Get info for both chapters
-        info1 = self.get_chapter_info(chapter1)
-        info2 = self.get_chapter_info(chapter2)
+        if chapter_infos is None:
+            chapter_infos = (
+                self.get_chapter_info(chapter1),
+                self.get_chapter_info(chapter2),
+            )
+        info1, info2 = chapter_infos
 
         # Calculate metrics
         chunks1 = info1.get("indexed_chunks", 0)
@@ -692,22 +993,35 @@ class BookRAG:
     # Source Diversity & Quality Methods
     # ========================================================================
 
-    def analyze_source_diversity(self, chapter: int) -> Dict[str, Any]:
+    def analyze_source_diversity(
+        self,
+        chapter: int,
+        chapter_chunks: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
         """Analyze diversity of source types for a chapter.
 
         Args:
             chapter: Chapter number
+            chapter_chunks: Pre-fetched chapter chunks (avoids another query)
 
         Returns:
-            Dict with source type breakdown and diversity metrics
+            Dict with source type breakdown (most common type first) and diversity
+            metrics
         """
         # Get all Zotero chunks for this chapter
-        results = self.search(
-            query="chapter content",
-            filters={"chapter_number": chapter, "source_type": "zotero"},
-            limit=1000,
-            score_threshold=0.0,
-        )
+        if chapter_chunks is None:
+            results = self.search(
+                query="",
+                filters={"chapter_number": chapter, "source_type": "zotero"},
+                limit=1000,
+                score_threshold=0.0,
+            )
+        else:
+            results = [
+                r
+                for r in chapter_chunks
+                if r["metadata"].get("source_type") == "zotero"
+            ]
 
         if not results:
             return {
@@ -728,11 +1042,12 @@ class BookRAG:
                 sources[title] = {"type": item_type, "chunk_count": 0}
             sources[title]["chunk_count"] += 1
 
-        # Group by item type
-        type_counts = {}
-        for source_info in sources.values():
-            item_type = source_info["type"]
-            type_counts[item_type] = type_counts.get(item_type, 0) + 1
+        # Group by item type, most common first
+        type_counts = dict(
+            Counter(
+                source_info["type"] for source_info in sources.values()
+            ).most_common()
+        )
 
         # Calculate diversity score (0-1, higher = more diverse)
         # Using Simpson's Diversity Index
@@ -755,7 +1070,7 @@ class BookRAG:
             "diversity_score": round(diversity_score, 2),
             "most_cited": [
                 {"title": title, "chunks": info["chunk_count"]}
-                for title, info in sorted_sources[:5]
+                for title, info in islice(sorted_sources, 5)
             ],
             "least_cited": [
                 {"title": title, "chunks": info["chunk_count"]}
@@ -764,24 +1079,25 @@ class BookRAG:
         }
 
     def identify_key_sources(
-        self, chapter: int, min_mentions: int = 3
+        self,
+        chapter: int,
+        min_mentions: int = 3,
+        chapter_chunks: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """Find most-referenced sources in a chapter.
 
         Args:
             chapter: Chapter number
             min_mentions: Minimum number of chunks to be considered "key"
+            chapter_chunks: Pre-fetched chapter chunks (avoids another query)
 
         Returns:
             Dict with key sources and their usage statistics
         """
         # Get all chunks for this chapter
-        results = self.search(
-            query="chapter content",
-            filters={"chapter_number": chapter},
-            limit=1000,
-            score_threshold=0.0,
-        )
+        if chapter_chunks is None:
+            chapter_chunks = self._get_chapter_chunks(chapter)
+        results = chapter_chunks
 
         # Count mentions per source
         sources = {}
@@ -829,10 +1145,13 @@ class BookRAG:
         Returns:
             Formatted summary string
         """
-        # Get comprehensive chapter info
-        info = self.get_chapter_info(chapter)
-        diversity = self.analyze_source_diversity(chapter)
-        key_sources = self.identify_key_sources(chapter)
+        # Get comprehensive chapter info from a single chapter query
+        chapter_chunks = self._get_chapter_chunks(chapter)
+        info = self.get_chapter_info(chapter, chapter_chunks=chapter_chunks)
+        diversity = self.analyze_source_diversity(
+            chapter, chapter_chunks=chapter_chunks
+        )
+        key_sources = self.identify_key_sources(chapter, chapter_chunks=chapter_chunks)
 
         if format == "json":
             import json
@@ -847,71 +1166,11 @@ class BookRAG:
                 indent=2,
             )
 
-        # Build markdown/text summary
-        lines = []
-        lines.append(f"# Chapter {chapter} Research Summary")
-        lines.append("")
-
-        # Overview
-        lines.append("## Overview")
-        lines.append(f"- Total indexed chunks: {info.get('indexed_chunks', 0)}")
-
-        zotero = info.get("zotero", {})
-        if zotero:
-            lines.append(
-                f"- Zotero sources: {zotero.get('source_count', 0)} "
-                f"({zotero.get('chunk_count', 0)} chunks)"
-            )
-
-        scrivener = info.get("scrivener", {})
-        if scrivener:
-            lines.append(
-                f"- Draft status: ~{scrivener.get('estimated_words', 0)} words"
-            )
-
-        lines.append("")
-
-        # Source diversity
-        lines.append("## Source Diversity")
-        lines.append(
-            f"- Diversity score: {diversity.get('diversity_score', 0):.2f} "
-            f"(0=homogeneous, 1=diverse)"
-        )
-        lines.append(f"- Total unique sources: {diversity.get('total_sources', 0)}")
-
-        source_types = diversity.get("source_types", {})
-        if source_types:
-            lines.append("- Source types:")
-            for item_type, count in sorted(
-                source_types.items(), key=lambda x: x[1], reverse=True
-            ):
-                lines.append(f"  - {item_type}: {count}")
-
-        lines.append("")
-
-        # Key sources
-        lines.append("## Key Sources")
-        key_srcs = key_sources.get("key_sources", [])
-        if key_srcs:
-            threshold = key_sources.get("threshold", 3)
-            lines.append(f"Found {len(key_srcs)} sources with {threshold}+ mentions:")
-            for src in key_srcs[:10]:  # Top 10
-                lines.append(
-                    f"- **{src['title']}** ({src['item_type']}): "
-                    f"{src['chunk_count']} chunks"
-                )
-        else:
-            lines.append("No key sources identified.")
-
-        lines.append("")
-
-        # Most cited sources
-        most_cited = diversity.get("most_cited", [])
-        if most_cited:
-            lines.append("## Most Cited Sources")
-            for src in most_cited:
-                lines.append(f"- {src['title']}: {src['chunks']} chunks")
-
+        # Build markdown/text summary, one section builder at a time
+        data = {"info": info, "diversity": diversity, "key_sources": key_sources}
+        lines = [f"# Chapter {chapter} Research Summary", ""]
+        for build_section in SUMMARY_SECTIONS:
+            lines.extend(build_section(data))
         lines.append("")
         lines.append("---")
         lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -942,7 +1201,7 @@ class BookRAG:
             filters["chapter_number"] = chapter
 
         results = self.search(
-            query="bibliography sources",
+            query="",
             filters=filters,
             limit=1000,
             score_threshold=0.0,
@@ -1133,7 +1392,7 @@ class BookRAG:
             filters["chapter_number"] = chapter
 
         results = self.search(
-            query="timeline", filters=filters, limit=1000, score_threshold=0.0
+            query="", filters=filters, limit=1000, score_threshold=0.0
         )
 
         # Extract dates from metadata
@@ -1208,9 +1467,10 @@ class BookRAG:
                 parser = ScrivenerParser(
                     scrivener_path, manuscript_folder=manuscript_folder or None
                 )
-                structure = parser.get_chapter_structure()
-                for ch in structure.get("chapters", []):
-                    chapter_titles_map[ch["number"]] = ch["title"]
+                chapter_titles_map = {
+                    number: chapter["title"]
+                    for number, chapter in parser.get_chapters_by_number().items()
+                }
             except Exception as e:
                 import structlog
 
@@ -1321,6 +1581,10 @@ class BookRAG:
     def suggest_related_research(self, chapter: int, limit: int = 5) -> Dict[str, Any]:
         """Suggest research from other chapters that might be relevant.
 
+        The chapter is represented by the centroid of the stored embeddings of
+        up to RELATED_RESEARCH_SAMPLE_SIZE of its chunks, read in index order;
+        chapters with fewer chunks are represented in full.
+
         Args:
             chapter: Chapter number to find suggestions for
             limit: Maximum number of suggestions
@@ -1328,12 +1592,11 @@ class BookRAG:
         Returns:
             Dict with suggested research from other chapters
         """
-        # Get a sample of content from the target chapter
-        chapter_results = self.search(
-            query="chapter content",
+        # Read the chapter's chunks with their stored embeddings
+        chapter_results = self.vectordb.list_chunks(
             filters={"chapter_number": chapter},
-            limit=10,
-            score_threshold=0.0,
+            limit=RELATED_RESEARCH_SAMPLE_SIZE,
+            with_vectors=True,
         )
 
         if not chapter_results:
@@ -1343,13 +1606,15 @@ class BookRAG:
                 "message": "No research found for this chapter",
             }
 
-        # Build a representative query from chapter content
-        # Use the most representative chunks
-        sample_texts = [r["text"][:200] for r in chapter_results[:3]]
-        query = " ".join(sample_texts)
+        # Use the centroid of the stored embeddings as the query vector,
+        # so no text has to be embedded for this lookup
+        vectors = [r["vector"] for r in chapter_results]
+        centroid = [sum(dim) / len(vectors) for dim in zip(*vectors)]
 
         # Search for similar content in OTHER chapters
-        all_results = self.search(query=query, limit=50, score_threshold=0.65)
+        all_results = self.vectordb.search_by_vector(
+            centroid, limit=50, score_threshold=0.65
+        )
 
         # Filter out results from the same chapter
         related = []
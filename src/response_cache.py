@@ -0,0 +1,128 @@
+"""
+Persistent cache for tool responses.
+
+Agent sessions are short-lived, so an in-process cache never warms up. This
+stores serialized tool responses in a small SQLite file keyed by a hash of the
+tool name, its arguments, and the current index generation (the last-indexed
+timestamps), so any re-index naturally invalidates older entries.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import structlog
+
+from . import json_utils
+
+logger = structlog.get_logger()
+
+# Anchored to the project root so the cache is shared whatever the working
+# directory
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / "data" / "response_cache.db"
+DEFAULT_TTL_SECONDS = 3600
+
+
+class ResponseCache:
+    """SQLite-backed key/value cache with per-entry expiry"""
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[int] = None):
+        """
+        Initialize response cache.
+
+        Args:
+            path: SQLite file path (defaults to RESPONSE_CACHE_PATH env variable,
+                then data/response_cache.db under the project root)
+            ttl: Entry lifetime in seconds (defaults to RESPONSE_CACHE_TTL env
+                variable); 0 disables the cache
+        """
+        self.path = Path(path or os.getenv("RESPONSE_CACHE_PATH", DEFAULT_CACHE_PATH))
+        self.ttl = (
+            ttl
+            if ttl is not None
+            else int(os.getenv("RESPONSE_CACHE_TTL", DEFAULT_TTL_SECONDS))
+        )
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_expires_at "
+                "ON responses (expires_at)"
+            )
+        return self._conn
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash canonicalized key parts into a cache key."""
+        return hashlib.sha256(json_utils.dumps_canonical(parts)).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached value, or None if missing, expired, or the cache is disabled
+        """
+        if self.ttl <= 0:
+            return None
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] < time.time():
+                    # Drop the stale entry rather than leaving it on disk
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    conn.commit()
+                    row = None
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+        return json_utils.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable value
+        """
+        if self.ttl <= 0:
+            return
+
+        try:
+            now = time.time()
+            with self._lock:
+                conn = self._connect()
+                # Purge expired entries; every re-index starts a new set of
+                # keys, so old ones would otherwise accumulate forever
+                conn.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                    (key, json_utils.dumps(value), now + self.ttl),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
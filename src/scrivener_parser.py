@@ -1,8 +1,30 @@
 """Parse Scrivener project structure from .scrivx file."""
 
+import copy
+import re
+import threading
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# Title classifiers; case-insensitive so callers match binder titles as-is
+# Front-matter titles numbered as chapter 0 (also matches "Introduction: ...")
+CHAPTER_ZERO_RE = re.compile(r"preface|introduction", re.IGNORECASE)
+PART_RE = re.compile(r"part ", re.IGNORECASE)
+UNTITLED_RE = re.compile(r"untitled", re.IGNORECASE)
+
+# Chapter number at the start of a binder title; alternatives are tried in
+# order: "1. Title", "Chapter 1", "Ch 1" / "Ch. 1", "1 - Title" / "1 — Title"
+TITLE_CHAPTER_RE = re.compile(
+    r"^(?:(\d+)\.|[Cc]hapter\s+(\d+)|[Cc]h\.?\s+(\d+)|(\d+)\s*[-–—])"
+)
+
+
+# Parsed structures keyed by (.scrivx path, mtime, manuscript folder), so the
+# binder XML is parsed once per project revision rather than once per call
+_structure_cache: Dict[Tuple[Path, int, Optional[str]], Dict] = {}
+_structure_cache_lock = threading.Lock()
+STRUCTURE_CACHE_SIZE = 8
 
 
 class ScrivenerParser:
@@ -36,9 +58,40 @@ class ScrivenerParser:
     def get_chapter_structure(self) -> Dict:
         """Extract chapter structure from Scrivener project.
 
+        The parse is cached until the .scrivx file changes; callers get their
+        own copy and may modify it freely.
+
         Returns:
             Dict with structure info including parts and chapters
         """
+        key = (
+            self.scrivx_file,
+            self.scrivx_file.stat().st_mtime_ns,
+            self.manuscript_folder,
+        )
+        with _structure_cache_lock:
+            cached = _structure_cache.get(key)
+        if cached is None:
+            cached = self._parse_chapter_structure()
+            with _structure_cache_lock:
+                if len(_structure_cache) >= STRUCTURE_CACHE_SIZE:
+                    _structure_cache.clear()
+                _structure_cache[key] = cached
+        return copy.deepcopy(cached)
+
+    def get_chapters_by_number(self) -> Dict[int, Dict]:
+        """Get chapter metadata (title, number, parent) keyed by chapter number.
+
+        Returns:
+            Dict mapping chapter number to its flattened chapter dict
+        """
+        return {
+            chapter["number"]: chapter
+            for chapter in self.get_chapter_structure().get("chapters", [])
+        }
+
+    def _parse_chapter_structure(self) -> Dict:
+        """Parse the binder XML into the structure dict (uncached)."""
         tree = ET.parse(self.scrivx_file)
         root = tree.getroot()
 
@@ -124,21 +177,10 @@ class ScrivenerParser:
         Returns:
             Chapter number if found, else None
         """
-        import re
-
-        # Match patterns like:
-        # "1. Title", "Chapter 1", "1 - Title", "Ch 1", etc.
-        patterns = [
-            r"^(\d+)\.",  # "1. Title"
-            r"^[Cc]hapter\s+(\d+)",  # "Chapter 1"
-            r"^[Cc]h\.?\s+(\d+)",  # "Ch 1" or "Ch. 1"
-            r"^(\d+)\s*[-–—]",  # "1 - Title" or "1 — Title"
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, title)
-            if match:
-                return int(match.group(1))
+        match = TITLE_CHAPTER_RE.match(title)
+        if match:
+            # Exactly one alternative (and so one group) participates
+            return int(match.group(match.lastindex))
 
         return None
 
@@ -165,14 +207,13 @@ class ScrivenerParser:
 
         # Track chapter 0 items (Preface, Introduction, etc.)
         chapter_zero_items = []
-        chapter_zero_names = ["preface", "introduction"]
 
         # Process top-level items in the manuscript folder
         for item in structure:
-            title = item.get("title", "").lower()
+            title = item.get("title", "")
 
             # Check if this is a "Part" folder
-            if item.get("is_folder") and title.startswith("part "):
+            if item.get("is_folder") and PART_RE.match(title):
                 # Process chapter folders inside the Part
                 if "children" in item:
                     for chapter in item["children"]:
@@ -180,12 +221,9 @@ class ScrivenerParser:
                             chapter_counter += 1
                             propagate_chapter_number(chapter, chapter_counter)
             # Or if it's a standalone item at level 0 (like Preface or Introduction)
-            elif title and title not in ["untitled", ""]:
+            elif title and not UNTITLED_RE.fullmatch(title):
                 # Check if this is a chapter 0 item (matches even with subtitles like "Introduction: The Code of Cool")
-                is_chapter_zero = any(
-                    title.startswith(name) or title.startswith(f"{name}:")
-                    for name in chapter_zero_names
-                )
+                is_chapter_zero = CHAPTER_ZERO_RE.match(title) is not None
                 if is_chapter_zero:
                     chapter_zero_items.append(item)
                 else:
@@ -256,7 +294,7 @@ class ScrivenerParser:
             for item in items:
                 has_chapter_num = "chapter_number" in item
                 title = item.get("title", "")
-                is_part = title.lower().startswith("part ")
+                is_part = PART_RE.match(title) is not None
 
                 # Include in chapters list if:
                 # 1. Has chapter number AND is at top level (parent_title is None) - e.g., Preface
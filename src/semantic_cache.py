@@ -0,0 +1,119 @@
+"""
+In-process semantic cache for search results.
+
+Agents often repeat the same search, or a light paraphrase of it, within a
+session. Lookups first try an exact match on the query text, then compare the
+query embedding against cached query embeddings and reuse results when the
+cosine similarity is above a threshold.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+
+class SemanticCache:
+    """Two-tier (exact + embedding similarity) LRU cache with TTL"""
+
+    def __init__(
+        self, max_entries: int = 512, threshold: float = 0.95, ttl: float = 600
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            max_entries: Maximum number of cached queries (LRU eviction)
+            threshold: Minimum cosine similarity for a semantic hit
+            ttl: Entry lifetime in seconds
+        """
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.ttl = ttl
+        # (scope, query) -> (unit vector, value, expires_at)
+        self._entries: "OrderedDict[Tuple[Hashable, str], tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_exact(self, scope: Hashable, query: str) -> Optional[Any]:
+        """
+        Look up a cached value by exact query text.
+
+        Args:
+            scope: Everything besides the query that affects the result
+                (filters, limits); only entries with the same scope match
+            query: Query text
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        key = (scope, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def get_similar(self, scope: Hashable, vector: List[float]) -> Optional[Any]:
+        """
+        Look up a cached value by query embedding similarity.
+
+        Args:
+            scope: Same scope value passed to get_exact()
+            vector: Query embedding
+
+        Returns:
+            Value of the most similar cached query above the threshold, or None
+        """
+        query = _unit(vector)
+        now = time.monotonic()
+        with self._lock:
+            keys = [
+                k for k, e in self._entries.items() if k[0] == scope and e[2] >= now
+            ]
+            if not keys:
+                return None
+
+            # One matrix-vector product scores every candidate
+            matrix = np.stack([self._entries[k][0] for k in keys])
+            scores = matrix @ query
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+
+            self._entries.move_to_end(keys[best])
+            return self._entries[keys[best]][1]
+
+    def put(self, scope: Hashable, query: str, vector: List[float], value: Any) -> None:
+        """
+        Store a value for a query.
+
+        Args:
+            scope: Same scope value passed to the getters
+            query: Query text
+            vector: Query embedding
+            value: Value to cache
+        """
+        key = (scope, query)
+        with self._lock:
+            self._entries[key] = (_unit(vector), value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _unit(vector: List[float]) -> np.ndarray:
+    """Convert an embedding to a float32 unit vector."""
+    array = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    return array / norm if norm else array
@@ -4,7 +4,6 @@ This module discovers skill definitions in config/skills/*.md and converts
 them into Claude Agent SDK tools that can be used by the agent.
 """
 
-import json
 import re
 from pathlib import Path
 from typing import Any
@@ -12,8 +11,36 @@ from typing import Any
 import structlog
 from claude_agent_sdk import tool
 
+from . import json_utils
+
 logger = structlog.get_logger()
 
+# Skill markdown section patterns, compiled once at import
+SKILL_NAME_RE = re.compile(r"\*\*Name:\*\*\s*`([^`]+)`")
+SKILL_DESCRIPTION_RE = re.compile(
+    r"\*\*Description:\*\*\s*(.+?)(?:\n\n|\*\*)", re.DOTALL
+)
+SKILL_PARAMETERS_RE = re.compile(
+    r"\*\*Parameters:\*\*\s*\n(.*?)(?:\n\n|\*\*)", re.DOTALL
+)
+PARAMETER_LINE_RE = re.compile(
+    r"^-\s+`?(\w+)`?\s*\(([^,]+)(?:,\s*(required|optional))?\):\s*(.+)$"
+)
+PARAMETER_DEFAULT_RE = re.compile(r"Default:\s*(.+?)\.?$")
+SKILL_WORKFLOW_RE = re.compile(
+    r"\*\*Workflow Steps:\*\*\s*\n(.*?)(?:\n\*\*Example|$)", re.DOTALL
+)
+WORKFLOW_STEP_RE = re.compile(r"^\d+\.\s+(.+)$")
+WORKFLOW_CONDITION_RE = re.compile(r"^\s+-\s+If\s+(.+)$")
+SKILL_EXAMPLES_RE = re.compile(r"\*\*Example Usage:\*\*\s*\n(.*?)$", re.DOTALL)
+
+PARAMETER_TYPES = {
+    "int": int,
+    "str": str,
+    "bool": bool,
+    "float": float,
+}
+
 
 def parse_skill_markdown(content: str) -> dict[str, Any] | None:
     """Parse a skill definition from markdown format.
@@ -47,50 +74,34 @@ def parse_skill_markdown(content: str) -> dict[str, Any] | None:
     }
 
     # Parse name (from **Name:** line)
-    name_match = re.search(r"\*\*Name:\*\*\s*`([^`]+)`", content)
+    name_match = SKILL_NAME_RE.search(content)
     if not name_match:
         return None
     result["name"] = name_match.group(1)
 
     # Parse description (from **Description:** line)
-    desc_match = re.search(
-        r"\*\*Description:\*\*\s*(.+?)(?:\n\n|\*\*)", content, re.DOTALL
-    )
+    desc_match = SKILL_DESCRIPTION_RE.search(content)
     if desc_match:
         result["description"] = desc_match.group(1).strip()
 
     # Parse parameters (handles "None" keyword)
-    param_section = re.search(
-        r"\*\*Parameters:\*\*\s*\n(.*?)(?:\n\n|\*\*)", content, re.DOTALL
-    )
+    param_section = SKILL_PARAMETERS_RE.search(content)
     if param_section:
         param_text = param_section.group(1).strip()
         if param_text.lower() != "none":
             for line in param_text.split("\n"):
-                param_match = re.match(
-                    r"^-\s+`?(\w+)`?\s*\(([^,]+)(?:,\s*(required|optional))?\):\s*(.+)$",
-                    line.strip(),
-                )
+                param_match = PARAMETER_LINE_RE.match(line.strip())
                 if param_match:
                     param_name = param_match.group(1)
                     param_type = param_match.group(2).strip()
                     param_required = param_match.group(3) != "optional"
                     param_desc = param_match.group(4).strip()
-
-                    type_map = {
-                        "int": int,
-                        "str": str,
-                        "bool": bool,
-                        "float": float,
-                    }
-                    py_type = type_map.get(param_type, str)
+                    py_type = PARAMETER_TYPES.get(param_type, str)
 
                     if param_required:
                         result["parameters"][param_name] = py_type
                     else:
-                        default_match = re.search(
-                            r"Default:\s*(.+?)\.?$", param_desc
-                        )
+                        default_match = PARAMETER_DEFAULT_RE.search(param_desc)
                         result["optional_parameters"][param_name] = {
                             "type": py_type,
                             "default": (
@@ -101,23 +112,19 @@ def parse_skill_markdown(content: str) -> dict[str, Any] | None:
                         }
 
     # Parse workflow steps (supports conditional sub-steps)
-    workflow_match = re.search(
-        r"\*\*Workflow Steps:\*\*\s*\n(.*?)(?:\n\*\*Example|$)", content, re.DOTALL
-    )
+    workflow_match = SKILL_WORKFLOW_RE.search(content)
     if workflow_match:
         workflow_text = workflow_match.group(1)
         for line in workflow_text.split("\n"):
-            step_match = re.match(r"^\d+\.\s+(.+)$", line.strip())
+            step_match = WORKFLOW_STEP_RE.match(line.strip())
             if step_match:
                 result["workflow_steps"].append(step_match.group(1))
-            cond_match = re.match(r"^\s+-\s+If\s+(.+)$", line.strip())
+            cond_match = WORKFLOW_CONDITION_RE.match(line.strip())
             if cond_match:
                 result["conditions"].append(cond_match.group(1))
 
     # Parse examples
-    example_match = re.search(
-        r"\*\*Example Usage:\*\*\s*\n(.*?)$", content, re.DOTALL
-    )
+    example_match = SKILL_EXAMPLES_RE.search(content)
     if example_match:
         example_text = example_match.group(1)
         for line in example_text.split("\n"):
@@ -129,6 +136,51 @@ def parse_skill_markdown(content: str) -> dict[str, Any] | None:
     return result
 
 
+def _coerce(value: Any, py_type: type) -> Any:
+    """Coerce a value to a declared parameter type, leaving it as-is on failure."""
+    if isinstance(value, py_type) and not (py_type is int and isinstance(value, bool)):
+        return value
+    if py_type is bool and isinstance(value, str):
+        return value.strip().lower() in ("true", "yes", "1")
+    try:
+        return py_type(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def compile_arg_validator(
+    parameters: dict[str, type], optional_parameters: dict[str, dict[str, Any]]
+):
+    """Build a reusable validator for a skill's arguments.
+
+    Defaults are parsed from markdown as strings, so they are converted to the
+    declared type once here rather than on every call.
+
+    Args:
+        parameters: Required parameter names mapped to Python types
+        optional_parameters: Optional parameter names mapped to type/default info
+
+    Returns:
+        Function taking raw tool args and returning a new, coerced args dict
+    """
+    types = dict(parameters)
+    defaults = {}
+    for pname, pinfo in optional_parameters.items():
+        types[pname] = pinfo["type"]
+        if pinfo.get("default") is not None:
+            defaults[pname] = _coerce(pinfo["default"], pinfo["type"])
+    type_items = tuple(types.items())
+
+    def validate(args: dict[str, Any]) -> dict[str, Any]:
+        validated = {**defaults, **args}
+        for pname, py_type in type_items:
+            if pname in args:
+                validated[pname] = _coerce(args[pname], py_type)
+        return validated
+
+    return validate
+
+
 def create_skill_tool(skill_def: dict[str, Any]):
     """Create a Claude Agent SDK tool from a skill definition.
 
@@ -146,18 +198,16 @@ def create_skill_tool(skill_def: dict[str, Any]):
         all_params[param_name] = param_info["type"]
     workflow_steps = skill_def["workflow_steps"]
     conditions = skill_def.get("conditions", [])
+    validate_args = compile_arg_validator(
+        skill_def["parameters"], skill_def.get("optional_parameters", {})
+    )
 
     @tool(name, description, all_params)
     async def skill_function(args: dict[str, Any]) -> dict[str, Any]:
         """Dynamically created skill function."""
-        # Apply defaults for missing optional parameters
-        for pname, pinfo in skill_def.get("optional_parameters", {}).items():
-            if pname not in args and pinfo.get("default") is not None:
-                args[pname] = pinfo["default"]
-
         guidance = {
             "workflow": name,
-            "parameters": args,
+            "parameters": validate_args(args),
             "next_steps": workflow_steps,
         }
         if conditions:
@@ -165,7 +215,7 @@ def create_skill_tool(skill_def: dict[str, Any]):
 
         return {
             "content": [
-                {"type": "text", "text": json.dumps(guidance, indent=2)}
+                {"type": "text", "text": json_utils.dumps(guidance, indent=True)}
             ]
         }
 
@@ -3,6 +3,7 @@
 Collect and organize Zotero annotations and notes.
 """
 
+import re
 import sqlite3
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -11,6 +12,9 @@ import structlog
 
 logger = structlog.get_logger()
 
+# HTML tags in Zotero note bodies
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+
 
 class AnnotationAggregator:
     """Extract and aggregate annotations from Zotero."""
@@ -115,9 +119,7 @@ class AnnotationAggregator:
             note_html, item_id, parent_id, parent_title = row
 
             # Strip HTML tags for plain text (simple approach)
-            import re
-
-            note_text = re.sub(r"<[^>]+>", "", note_html)
+            note_text = HTML_TAG_RE.sub("", note_html)
 
             annotations.append(
                 {
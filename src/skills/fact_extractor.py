@@ -4,7 +4,27 @@ Identifies and extracts notable quotes, statistics, and facts from sources.
 """
 
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+# Patterns are compiled once at import; extraction runs on every indexed chunk
+STAT_RE = re.compile(
+    r"\d+[\d,\.]*\s*(?:%|percent|billion|million|thousand|USD|dollars?|GB|TB|MB|Mbps|Gbps)",
+    re.IGNORECASE,
+)
+QUOTE_RE = re.compile(r'["\u201C]([^"\u201D]{20,200})["\u201D]')
+DEFINITION_RE = re.compile(
+    r"(?:is defined as|refers to|means|is a type of|is known as)", re.IGNORECASE
+)
+CASE_STUDY_RE = re.compile(
+    r"(?:in the case of|for example|for instance|such as)", re.IGNORECASE
+)
+
+FACT_TYPES = ("statistic", "quote", "definition", "case_study")
+
+# Limits on the facts stored in chunk metadata (Qdrant payloads); fact_types
+# and fact_count still describe every fact found in the chunk
+MAX_STORED_FACTS_PER_TYPE = 5
+MAX_FACT_VALUE_CHARS = 300
 
 
 class FactExtractor:
@@ -13,69 +33,77 @@ class FactExtractor:
     def __init__(self):
         """Initialize fact extractor with patterns."""
         # Regex patterns for fact types
-        self.stat_pattern = r"\d+[\d,\.]*\s*(?:%|percent|billion|million|thousand|USD|dollars?|GB|TB|MB|Mbps|Gbps)"
-        self.quote_pattern = r'["\u201C]([^"\u201D]{20,200})["\u201D]'
-        self.definition_pattern = (
-            r"(?:is defined as|refers to|means|is a type of|is known as)"
-        )
-        self.case_study_pattern = r"(?:in the case of|for example|for instance|such as)"
+        self.stat_pattern = STAT_RE.pattern
+        self.quote_pattern = QUOTE_RE.pattern
+        self.definition_pattern = DEFINITION_RE.pattern
+        self.case_study_pattern = CASE_STUDY_RE.pattern
 
     def extract_facts(
-        self, text: str, metadata: Dict[str, Any]
+        self,
+        text: str,
+        metadata: Dict[str, Any],
+        fact_types: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Extract facts from text chunk.
 
         Args:
             text: Text to analyze
             metadata: Metadata about the source
+            fact_types: Only scan for these types (default: all FACT_TYPES)
 
         Returns:
             List of fact dictionaries with type, value, and context
         """
+        wanted = FACT_TYPES if fact_types is None else fact_types
         facts = []
 
         # Find statistics
-        for match in re.finditer(self.stat_pattern, text, re.IGNORECASE):
-            facts.append(
-                {
-                    "type": "statistic",
-                    "value": match.group(),
-                    "context": text[max(0, match.start() - 50) : match.end() + 50],
-                    **metadata,
-                }
-            )
-
-        # Find quotes
-        for match in re.finditer(self.quote_pattern, text):
-            quote_text = match.group(1)
-            # Skip if quote is too short or generic
-            if len(quote_text) > 30:
+        if "statistic" in wanted:
+            for match in STAT_RE.finditer(text):
                 facts.append(
                     {
-                        "type": "quote",
-                        "value": quote_text,
+                        "type": "statistic",
+                        "value": match.group(),
                         "context": text[max(0, match.start() - 50) : match.end() + 50],
                         **metadata,
                     }
                 )
 
-        # Check for definitions
-        if re.search(self.definition_pattern, text, re.IGNORECASE):
-            # Extract the sentence containing the definition
-            sentences = text.split(". ")
-            for sentence in sentences:
-                if re.search(self.definition_pattern, sentence, re.IGNORECASE):
+        # Find quotes
+        if "quote" in wanted:
+            for match in QUOTE_RE.finditer(text):
+                quote_text = match.group(1)
+                # Skip if quote is too short or generic
+                if len(quote_text) > 30:
                     facts.append(
                         {
-                            "type": "definition",
-                            "value": sentence.strip(),
+                            "type": "quote",
+                            "value": quote_text,
+                            "context": text[
+                                max(0, match.start() - 50) : match.end() + 50
+                            ],
                             **metadata,
                         }
                     )
-                    break
+
+        # Check for definitions
+        match = DEFINITION_RE.search(text) if "definition" in wanted else None
+        if match:
+            # Extract the sentence containing the first definition, bounded by
+            # the same ". " separators a split would use
+            start = text.rfind(". ", 0, match.start())
+            end = text.find(". ", match.end())
+            sentence = text[start + 2 if start >= 0 else 0 : end if end >= 0 else None]
+            facts.append(
+                {
+                    "type": "definition",
+                    "value": sentence.strip(),
+                    **metadata,
+                }
+            )
 
         # Check for case studies/examples
-        if re.search(self.case_study_pattern, text, re.IGNORECASE):
+        if "case_study" in wanted and CASE_STUDY_RE.search(text):
             facts.append(
                 {
                     "type": "case_study",
@@ -86,6 +114,31 @@ class FactExtractor:
 
         return facts
 
+    def compact_facts(self, facts: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """Reduce facts to type and value, within the stored-fact limits.
+
+        Keeps the first MAX_STORED_FACTS_PER_TYPE facts of each type, so every
+        type listed in fact_types has stored examples, and truncates values to
+        MAX_FACT_VALUE_CHARS.
+
+        Args:
+            facts: Facts from extract_facts()
+
+        Returns:
+            List of {"type", "value"} dictionaries
+        """
+        per_type: Dict[str, int] = {}
+        compact = []
+        for f in facts:
+            seen = per_type.get(f["type"], 0)
+            if seen >= MAX_STORED_FACTS_PER_TYPE:
+                continue
+            per_type[f["type"]] = seen + 1
+            compact.append(
+                {"type": f["type"], "value": f["value"][:MAX_FACT_VALUE_CHARS]}
+            )
+        return compact
+
     def extract_and_tag_chunk(
         self, text: str, metadata: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -100,10 +153,12 @@ class FactExtractor:
         """
         facts = self.extract_facts(text, {})
 
-        # Add fact tags to metadata
+        # Add fact tags to metadata; a capped sample of the facts is stored
+        # too so queries can read them without re-extracting
         if facts:
             metadata["has_facts"] = True
             metadata["fact_types"] = list({f["type"] for f in facts})
             metadata["fact_count"] = len(facts)
+            metadata["facts"] = self.compact_facts(facts)
 
         return metadata
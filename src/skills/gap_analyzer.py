@@ -3,13 +3,63 @@
 Identify areas needing more research by analyzing source density and coverage.
 """
 
-from collections import defaultdict
+import re
+from collections import Counter, defaultdict
 from typing import Any, Dict, List, Optional
 
 import structlog
 
 logger = structlog.get_logger()
 
+# Words too common to suggest as search terms
+COMMON_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "from",
+        "as",
+        "is",
+        "was",
+        "are",
+        "were",
+        "been",
+        "be",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "must",
+        "can",
+        "this",
+        "that",
+        "these",
+        "those",
+    }
+)
+
+# Whitespace-delimited words longer than 3 characters
+CANDIDATE_WORD_RE = re.compile(r"\S{4,}")
+
 
 class ResearchGapDetector:
     """Detect research gaps by analyzing source coverage."""
@@ -195,57 +245,13 @@ class ResearchGapDetector:
         # This is a simplified version - could use NLP for better results
         text = " ".join(chunk["text"] for chunk in draft_chunks[:10])
 
-        # Simple keyword extraction (could be enhanced)
-        words = text.lower().split()
-        common_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "from",
-            "as",
-            "is",
-            "was",
-            "are",
-            "were",
-            "been",
-            "be",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "must",
-            "can",
-            "this",
-            "that",
-            "these",
-            "those",
-        }
-
-        word_freq = defaultdict(int)
-        for word in words:
-            if len(word) > 3 and word not in common_words:
-                word_freq[word] += 1
+        # Simple keyword extraction (could be enhanced): one regex pass yields
+        # the candidate words (more than 3 characters) for counting
+        word_freq = Counter(
+            word
+            for word in CANDIDATE_WORD_RE.findall(text.lower())
+            if word not in COMMON_WORDS
+        )
 
         # Get top terms
-        top_terms = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:10]
-
-        return [term for term, _ in top_terms]
+        return [term for term, _ in word_freq.most_common(10)]
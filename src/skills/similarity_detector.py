@@ -62,7 +62,9 @@ class SimilarityDetector:
         """
         # Get all chunks for this chapter
         filters = {"chapter_number": chapter_number}
-        chunks = self.vectordb.search("", filters=filters, limit=500)
+        chunks = self.vectordb.list_chunks(
+            filters=filters, limit=500, with_vectors=True
+        )
 
         if len(chunks) < 2:
             return {
@@ -80,9 +82,9 @@ class SimilarityDetector:
             if i in processed:
                 continue
 
-            # Search for similar chunks
-            similar = self.vectordb.search(
-                chunk["text"], limit=10, score_threshold=threshold
+            # Search for similar chunks using the stored embedding
+            similar = self.vectordb.search_by_vector(
+                chunk["vector"], limit=10, score_threshold=threshold
             )
 
             # Filter to same chapter and not self
@@ -154,24 +156,37 @@ class SimilarityDetector:
         source_ids = list(by_source.keys())
         redundant_pairs = []
 
-        for i, source_a in enumerate(source_ids):
-            for source_b in source_ids[i + 1 :]:
-                # Compare chunks from both sources
-                similarity_scores = []
-
-                for chunk_a in by_source[source_a][:5]:  # Sample first 5 chunks
-                    similar = self.vectordb.search(
-                        chunk_a["text"], limit=5, score_threshold=threshold
-                    )
-
-                    for result in similar:
-                        if result.get("metadata", {}).get("item_id") == source_b:
-                            similarity_scores.append(result["score"])
+        # Neighbours of each source's first 5 chunks, fetched once per source
+        # in a single batched query rather than once per source pair
+        neighbours = {
+            source_id: [
+                result
+                for results in self.vectordb.search_batch(
+                    [chunk["text"] for chunk in by_source[source_id][:5]],
+                    limit=5,
+                    score_threshold=threshold,
+                )
+                for result in results
+            ]
+            for source_id in source_ids
+        }
 
+        # Single pass over each source's neighbours, keeping a running
+        # (score sum, match count) per later source instead of rescanning the
+        # neighbour list once for every source pair
+        position = {source_id: i for i, source_id in enumerate(source_ids)}
+        for i, source_a in enumerate(source_ids):
+            totals = {}
+            for result in neighbours[source_a]:
+                source_b = result.get("metadata", {}).get("item_id")
+                if position.get(source_b, -1) <= i:
+                    continue
+                score_sum, count = totals.get(source_b, (0.0, 0))
+                totals[source_b] = (score_sum + result["score"], count + 1)
+
+            for source_b, (score_sum, count) in totals.items():
                 # If many high-similarity matches, sources may be redundant
-                if len(similarity_scores) >= 3:
-                    avg_similarity = sum(similarity_scores) / len(similarity_scores)
-
+                if count >= 3:
                     redundant_pairs.append(
                         {
                             "source_a": {
@@ -186,8 +201,8 @@ class SimilarityDetector:
                                 .get("metadata", {})
                                 .get("title", "Unknown"),
                             },
-                            "similarity_score": avg_similarity,
-                            "match_count": len(similarity_scores),
+                            "similarity_score": score_sum / count,
+                            "match_count": count,
                         }
                     )
 
@@ -6,6 +6,16 @@ from typing import Dict, List, Optional
 
 from .vectordb.client import QdrantClient
 
+# Outline lines like "Chapter 1: Title", "Chapter 1. Title" or "1. Title".
+# One pass per line; the "Chapter N" form anywhere in the line wins over a
+# leading "N." number
+OUTLINE_CHAPTER_RE = re.compile(
+    r"^(?:.*?[Cc]hapter\s+(?P<num>\d+)[:\.]?\s*[:-]?\s*(?P<title>.+)"
+    r"|\s*(?P<list_num>\d+)\.\s+(?P<list_title>.+))"
+)
+# Trailing " - extra info" stripped from outline titles
+TITLE_SUFFIX_RE = re.compile(r"\s*-\s*.+$")
+
 
 class SyncChecker:
     """Check consistency between outline.txt, Zotero collections, and Scrivener structure."""
@@ -59,25 +69,14 @@ class SyncChecker:
         content = self.outline_path.read_text()
         chapters = {}
 
-        # Match patterns like:
-        # - Chapter 1: Title
-        # - 1. Title
-        # - Chapter 1. Title
-        patterns = [
-            r"[Cc]hapter\s+(\d+)[:\.]?\s*[:-]?\s*(.+)",
-            r"^\s*(\d+)\.\s+(.+)",
-        ]
-
         for line in content.split("\n"):
-            for pattern in patterns:
-                match = re.search(pattern, line)
-                if match:
-                    num = int(match.group(1))
-                    title = match.group(2).strip()
-                    # Clean up title (remove trailing dashes, extra info)
-                    title = re.sub(r"\s*-\s*.+$", "", title).strip()
-                    chapters[num] = title
-                    break
+            match = OUTLINE_CHAPTER_RE.match(line)
+            if match:
+                num = int(match["num"] or match["list_num"])
+                title = (match["title"] or match["list_title"]).strip()
+                # Clean up title (remove trailing dashes, extra info)
+                title = TITLE_SUFFIX_RE.sub("", title).strip()
+                chapters[num] = title
 
         return chapters
 
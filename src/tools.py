@@ -4,13 +4,18 @@ These tools wrap BookRAG methods and provide direct access to the vector databas
 and research capabilities.
 """
 
-import json
+import asyncio
+import functools
+import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from claude_agent_sdk import tool
 
+from . import json_utils
 from .rag import BookRAG
+from .response_cache import ResponseCache
 
 # Thread-safe singleton for RAG instance
 _rag_instance = None
@@ -37,6 +42,118 @@ def initialize_rag() -> None:
     get_rag()  # Trigger initialization
 
 
+# Bounded worker pool for blocking RAG calls (Qdrant I/O, embedding, sqlite),
+# so tool handlers never block the agent's event loop
+_rag_executor = ThreadPoolExecutor(
+    max_workers=min(8, (os.cpu_count() or 1) + 4), thread_name_prefix="rag"
+)
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """Run a blocking function on the RAG worker pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _rag_executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+# Persistent cache for expensive analysis tool responses
+_response_cache = ResponseCache()
+
+
+def _cached_response(func):
+    """Serve repeated tool calls from the persistent response cache.
+
+    Entries are keyed by tool name, arguments, and the last-indexed timestamps,
+    so a re-index by the watcher invalidates them.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(args: dict[str, Any]) -> dict[str, Any]:
+        generation = await _run_blocking(get_rag().vectordb.get_index_timestamps)
+        key = _response_cache.make_key(func.__name__, args, generation)
+        cached = await _run_blocking(_response_cache.get, key)
+        if cached is not None:
+            return cached
+
+        result = await func(args)
+        await _run_blocking(_response_cache.set, key, result)
+        return result
+
+    return wrapper
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result to indented JSON text."""
+    return json_utils.dumps(obj, indent=True)
+
+
+def _tc(obj: Any) -> dict[str, Any]:
+    """Wrap a tool result as a single text content response."""
+    return {"content": [{"type": "text", "text": _dumps(obj)}]}
+
+
+# Number of result items serialized per content block
+RESULT_BATCH_SIZE = 10
+
+
+def _text_blocks(header: dict[str, Any], key: str, items: list) -> list[dict]:
+    """Split a large tool response into several text content blocks.
+
+    The header is emitted first, followed by one block per batch of items, so
+    each serialization stays small and the client can start parsing early.
+
+    Args:
+        header: Metadata describing the response
+        key: Name of the list field carried by each batch block
+        items: Result items to serialize in batches
+
+    Returns:
+        List of text content blocks
+    """
+    blocks = [{"type": "text", "text": _dumps(header)}]
+    for start in range(0, len(items), RESULT_BATCH_SIZE):
+        batch = {key: items[start : start + RESULT_BATCH_SIZE], "offset": start}
+        blocks.append({"type": "text", "text": _dumps(batch)})
+    return blocks
+
+
+def _format_results(results: list) -> list[dict]:
+    """Shape search hits for tool output, truncating long texts.
+
+    Args:
+        results: Hits from BookRAG.search()
+
+    Returns:
+        List of result items with text, score, source, chapter and source_type
+    """
+    items = []
+    for r in results:
+        meta = r["metadata"]
+        items.append(
+            {
+                "text": r["text"][:500],  # Truncate long texts
+                "score": f"{r['score']:.0%}",
+                "source": meta.get("title", "Unknown"),
+                "chapter": meta.get("chapter_number"),
+                "source_type": meta.get("source_type"),
+            }
+        )
+    return items
+
+
+def _search_filters(args: dict[str, Any]) -> dict[str, Any] | None:
+    """Build search filters from the optional chapter and source_type arguments."""
+    filters = {}
+    chapter = args.get("chapter")
+    if chapter:
+        filters["chapter_number"] = chapter
+    source_type = args.get("source_type")
+    if source_type:
+        filters["source_type"] = source_type
+    return filters or None
+
+
 # =============================================================================
 # Core Research Tools
 # =============================================================================
@@ -59,39 +176,84 @@ async def search_research(args: dict[str, Any]) -> dict[str, Any]:
     """
     rag = get_rag()
 
-    # Build filters
-    filters = {}
-    if args.get("chapter"):
-        filters["chapter_number"] = args["chapter"]
-    if args.get("source_type"):
-        filters["source_type"] = args["source_type"]
-
-    results = rag.search(
+    results = await _run_blocking(
+        rag.search,
         query=args["query"],
-        filters=filters if filters else None,
+        filters=_search_filters(args),
         limit=args.get("limit", 20),
         score_threshold=0.6,
     )
 
-    # Format for easy consumption
-    output = {
+    # Header first, then results in small batches
+    header = {
         "query": args["query"],
         "chapter_filter": args.get("chapter"),
         "source_type_filter": args.get("source_type") or "all (zotero + scrivener)",
         "result_count": len(results),
-        "results": [
-            {
-                "text": r["text"][:500],  # Truncate long texts
-                "score": f"{r['score']:.0%}",
-                "source": r["metadata"].get("title", "Unknown"),
-                "chapter": r["metadata"].get("chapter_number"),
-                "source_type": r["metadata"].get("source_type"),
-            }
-            for r in results
-        ],
     }
+    return {"content": _text_blocks(header, "results", _format_results(results))}
+
+
+@tool(
+    "search_research_batch",
+    "Run several related searches at once (e.g. different angles on one question)",
+    {
+        "queries": list[str],
+        "chapter": int,
+        "source_type": str,
+        "limit": int,
+    },
+)
+async def search_research_batch(args: dict[str, Any]) -> dict[str, Any]:
+    """Run several semantic searches in one request.
+
+    Prefer this over repeated search_research calls when a question needs
+    multiple queries: they share one embedding pass and one database request.
+    """
+    rag = get_rag()
+
+    queries = args["queries"]
+    batches = await _run_blocking(
+        rag.search_batch,
+        queries=queries,
+        filters=_search_filters(args),
+        limit=args.get("limit", 10),
+        score_threshold=0.6,
+    )
+
+    # One summary block, then one block per query
+    header = {
+        "queries": queries,
+        "chapter_filter": args.get("chapter"),
+        "source_type_filter": args.get("source_type") or "all (zotero + scrivener)",
+        "result_counts": [len(results) for results in batches],
+    }
+    blocks = [{"type": "text", "text": _dumps(header)}]
+    for query, results in zip(queries, batches):
+        batch = {"query": query, "results": _format_results(results)}
+        blocks.append({"type": "text", "text": _dumps(batch)})
+    return {"content": blocks}
+
 
-    return {"content": [{"type": "text", "text": json.dumps(output, indent=2)}]}
+@tool(
+    "find_facts",
+    "Find statistics, quotes, definitions, or examples about a topic",
+    {"topic": str, "chapter": int, "fact_type": str},
+)
+async def find_facts(args: dict[str, Any]) -> dict[str, Any]:
+    """Find statistics, quotes, definitions, or examples about a topic.
+
+    fact_type narrows results to one of: statistic, quote, definition, case_study.
+    """
+    rag = get_rag()
+    result = await _run_blocking(
+        rag.find_facts,
+        topic=args["topic"],
+        chapter=args.get("chapter"),
+        fact_type=args.get("fact_type") or None,
+    )
+    facts = result.pop("facts")
+    return {"content": _text_blocks(result, "facts", facts)}
 
 
 @tool(
@@ -105,8 +267,13 @@ async def get_annotations(args: dict[str, Any]) -> dict[str, Any]:
     Retrieves all your highlights, notes, and annotations from Zotero sources.
     """
     rag = get_rag()
-    result = rag.get_annotations(chapter=args.get("chapter"))
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+    result = await _run_blocking(rag.get_annotations, chapter=args.get("chapter"))
+    if "sources" not in result:
+        return _tc(result)
+
+    # Emit the totals first, then annotated sources in batches
+    sources = result.pop("sources")
+    return {"content": _text_blocks(result, "sources", sources)}
 
 
 @tool(
@@ -114,14 +281,17 @@ async def get_annotations(args: dict[str, Any]) -> dict[str, Any]:
     "Get comprehensive information about a specific chapter",
     {"chapter_number": int},
 )
+@_cached_response
 async def get_chapter_info(args: dict[str, Any]) -> dict[str, Any]:
     """Get comprehensive information about a specific chapter.
 
     Includes source counts, word counts, and indexed content statistics.
     """
     rag = get_rag()
-    result = rag.get_chapter_info(chapter_number=args["chapter_number"])
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+    result = await _run_blocking(
+        rag.get_chapter_info, chapter_number=args["chapter_number"]
+    )
+    return _tc(result)
 
 
 @tool(
@@ -135,8 +305,8 @@ async def list_chapters(args: dict[str, Any]) -> dict[str, Any]:
     Returns the definitive chapter structure with numbers and titles.
     """
     rag = get_rag()
-    result = rag.list_chapters()
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+    result = await _run_blocking(rag.list_chapters)
+    return _tc(result)
 
 
 @tool(
@@ -150,8 +320,8 @@ async def check_sync(args: dict[str, Any]) -> dict[str, Any]:
     Identifies mismatches and provides recommendations.
     """
     rag = get_rag()
-    result = rag.check_sync()
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+    result = await _run_blocking(rag.check_sync)
+    return _tc(result)
 
 
 @tool(
@@ -165,8 +335,8 @@ async def get_scrivener_summary(args: dict[str, Any]) -> dict[str, Any]:
     Shows how many documents, chunks, and words are indexed for each chapter.
     """
     rag = get_rag()
-    result = rag.get_scrivener_summary()
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+    result = await _run_blocking(rag.get_scrivener_summary)
+    return _tc(result)
 
 
 # =============================================================================
@@ -179,14 +349,24 @@ async def get_scrivener_summary(args: dict[str, Any]) -> dict[str, Any]:
     "Compare research density and coverage between two chapters",
     {"chapter1": int, "chapter2": int},
 )
+@_cached_response
 async def compare_chapters(args: dict[str, Any]) -> dict[str, Any]:
     """Compare research density and coverage between two chapters.
 
     Shows which chapter has more sources, research density, etc.
     """
     rag = get_rag()
-    result = rag.compare_chapters(chapter1=args["chapter1"], chapter2=args["chapter2"])
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+
+    # The two chapter lookups are independent Qdrant reads; run them side by
+    # side so the tool waits for the slower one rather than their sum
+    chapter_infos = await asyncio.gather(
+        _run_blocking(rag.get_chapter_info, args["chapter1"]),
+        _run_blocking(rag.get_chapter_info, args["chapter2"]),
+    )
+    result = rag.compare_chapters(
+        args["chapter1"], args["chapter2"], chapter_infos=tuple(chapter_infos)
+    )
+    return _tc(result)
 
 
 @tool(
@@ -194,14 +374,22 @@ async def compare_chapters(args: dict[str, Any]) -> dict[str, Any]:
     "Track a theme or concept across all chapters",
     {"keyword": str},
 )
+@_cached_response
 async def find_cross_chapter_themes(args: dict[str, Any]) -> dict[str, Any]:
     """Track a theme or concept across all chapters.
 
     Finds where a theme appears and how it's discussed in different chapters.
     """
     rag = get_rag()
-    result = rag.find_cross_chapter_themes(keyword=args["keyword"], min_chapters=1)
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+    result = await _run_blocking(
+        rag.find_cross_chapter_themes, keyword=args["keyword"], min_chapters=1
+    )
+    if "chapters" not in result:
+        return _tc(result)
+
+    # Emit the summary first, then per-chapter mentions in batches
+    chapters = result.pop("chapters")
+    return {"content": _text_blocks(result, "chapters", chapters)}
 
 
 @tool(
@@ -209,14 +397,15 @@ async def find_cross_chapter_themes(args: dict[str, Any]) -> dict[str, Any]:
     "Analyze diversity of source types for a chapter",
     {"chapter": int},
 )
+@_cached_response
 async def analyze_source_diversity(args: dict[str, Any]) -> dict[str, Any]:
     """Analyze diversity of source types for a chapter.
 
     Checks if chapter relies too heavily on one type of source.
     """
     rag = get_rag()
-    result = rag.analyze_source_diversity(chapter=args["chapter"])
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+    result = await _run_blocking(rag.analyze_source_diversity, chapter=args["chapter"])
+    return _tc(result)
 
 
 @tool(
@@ -224,14 +413,17 @@ async def analyze_source_diversity(args: dict[str, Any]) -> dict[str, Any]:
     "Find the most-cited sources in a chapter",
     {"chapter": int},
 )
+@_cached_response
 async def identify_key_sources(args: dict[str, Any]) -> dict[str, Any]:
     """Find the most-cited sources in a chapter.
 
     Shows which sources you reference most frequently.
     """
     rag = get_rag()
-    result = rag.identify_key_sources(chapter=args["chapter"], min_mentions=2)
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+    result = await _run_blocking(
+        rag.identify_key_sources, chapter=args["chapter"], min_mentions=2
+    )
+    return _tc(result)
 
 
 # =============================================================================
@@ -244,21 +436,24 @@ async def identify_key_sources(args: dict[str, Any]) -> dict[str, Any]:
     "Generate a formatted research summary for a chapter",
     {"chapter": int, "format": str},
 )
+@_cached_response
 async def export_chapter_summary(args: dict[str, Any]) -> dict[str, Any]:
     """Generate a formatted research summary for a chapter.
 
     Creates a comprehensive overview of research for the chapter.
     """
     rag = get_rag()
-    summary = rag.export_chapter_summary(
-        chapter=args["chapter"], format=args.get("format", "markdown")
+    summary = await _run_blocking(
+        rag.export_chapter_summary,
+        chapter=args["chapter"],
+        format=args.get("format", "markdown"),
     )
     result = {
         "chapter": args["chapter"],
         "format": args.get("format", "markdown"),
         "summary": summary,
     }
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+    return _tc(result)
 
 
 @tool(
@@ -266,22 +461,24 @@ async def export_chapter_summary(args: dict[str, Any]) -> dict[str, Any]:
     "Generate formatted bibliography from Zotero sources",
     {"chapter": int, "style": str},
 )
+@_cached_response
 async def generate_bibliography(args: dict[str, Any]) -> dict[str, Any]:
     """Generate formatted bibliography from Zotero sources.
 
     Creates citation list in APA, MLA, or Chicago style.
     """
     rag = get_rag()
-    bibliography = rag.generate_bibliography(
-        chapter=args.get("chapter"), style=args.get("style", "apa")
+    bibliography = await _run_blocking(
+        rag.generate_bibliography,
+        chapter=args.get("chapter"),
+        style=args.get("style", "apa"),
     )
-    result = {
+    header = {
         "chapter": args.get("chapter"),
         "style": args.get("style", "apa"),
         "citation_count": len(bibliography),
-        "citations": bibliography,
     }
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+    return {"content": _text_blocks(header, "citations", bibliography)}
 
 
 # =============================================================================
@@ -291,6 +488,8 @@ async def generate_bibliography(args: dict[str, Any]) -> dict[str, Any]:
 # All research tools available to the agent
 ALL_TOOLS = [
     search_research,
+    search_research_batch,
+    find_facts,
     get_annotations,
     get_chapter_info,
     list_chapters,
@@ -4,10 +4,14 @@ Vector database client wrapper for Qdrant.
 Handles embeddings storage, retrieval, and search operations.
 """
 
+import os
 import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import httpx
 import structlog
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
@@ -15,16 +19,77 @@ from qdrant_client.models import (
     FieldCondition,
     Filter,
     MatchValue,
+    PayloadSchemaType,
     PointStruct,
+    QueryRequest,
     VectorParams,
 )
 
-# Lazy import - SentenceTransformer loads PyTorch which takes 10+ seconds
-# Only import when actually needed (in embedder property)
-# from sentence_transformers import SentenceTransformer
+from ..embeddings import encode, get_model
 
 logger = structlog.get_logger()
 
+# Qdrant connections shared by every VectorDBClient in the process, keyed by
+# connection settings, so indexers, BookRAG and skills reuse one pooled client
+_qdrant_clients: Dict[tuple, QdrantClient] = {}
+_qdrant_clients_lock = threading.Lock()
+
+# HTTP keep-alive pool and gRPC channel settings for server mode
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=64, max_keepalive_connections=32, keepalive_expiry=60
+)
+# Payload fields filtered on at query time get a Qdrant payload index
+PAYLOAD_INDEXES = {"fact_types": PayloadSchemaType.KEYWORD}
+
+# Seconds a cached get_collection_info() result is served without a round-trip
+COLLECTION_INFO_TTL = 5.0
+
+# Seconds cached index timestamps are served; they key the response caches and
+# are read on every cached tool call, so bursts share one round-trip
+INDEX_TIMESTAMPS_TTL = 1.0
+
+# Number of recent query embeddings kept per client
+QUERY_EMBEDDING_CACHE_SIZE = 4096
+
+GRPC_OPTIONS = {
+    "grpc.max_send_message_length": 64 << 20,
+    "grpc.max_receive_message_length": 64 << 20,
+}
+
+
+def _get_qdrant_client(
+    qdrant_url: Optional[str] = None,
+    db_path: Optional[str] = None,
+    prefer_grpc: bool = False,
+    grpc_port: int = 6334,
+) -> QdrantClient:
+    """Get or create the shared QdrantClient for a server URL or storage path."""
+    key = (qdrant_url, db_path, prefer_grpc, grpc_port)
+    with _qdrant_clients_lock:
+        client = _qdrant_clients.get(key)
+        if client is None:
+            if qdrant_url:
+                client = QdrantClient(
+                    url=qdrant_url,
+                    prefer_grpc=prefer_grpc,
+                    grpc_port=grpc_port,
+                    grpc_options=GRPC_OPTIONS,
+                    timeout=30,
+                    limits=HTTP_POOL_LIMITS,
+                )
+                logger.debug(
+                    "Created pooled Qdrant client",
+                    url=qdrant_url,
+                    prefer_grpc=prefer_grpc,
+                    max_connections=HTTP_POOL_LIMITS.max_connections,
+                    max_keepalive=HTTP_POOL_LIMITS.max_keepalive_connections,
+                )
+            else:
+                # Local storage locks its directory, so it must be shared anyway
+                client = QdrantClient(path=db_path)
+            _qdrant_clients[key] = client
+        return client
+
 
 class VectorDBClient:
     """Wrapper for Qdrant vector database with embedding generation"""
@@ -37,6 +102,7 @@ class VectorDBClient:
         embedding_model: str = "all-MiniLM-L6-v2",
         vector_size: int = 384,
         model_cache_dir: str = None,
+        prefer_grpc: Optional[bool] = None,
     ):
         """
         Initialize vector database client.
@@ -48,6 +114,8 @@ class VectorDBClient:
             embedding_model: SentenceTransformer model name
             vector_size: Dimension of embeddings
             model_cache_dir: Path to local model cache (for offline operation)
+            prefer_grpc: Use gRPC transport in server mode (defaults to the
+                QDRANT_PREFER_GRPC env variable)
         """
         self.collection_name = collection_name
         self.vector_size = vector_size
@@ -55,12 +123,25 @@ class VectorDBClient:
 
         # Initialize Qdrant client (server mode or local mode)
         if qdrant_url:
-            logger.info(f"Connecting to Qdrant server: {qdrant_url}")
-            self.client = QdrantClient(url=qdrant_url)
+            if prefer_grpc is None:
+                prefer_grpc = os.getenv("QDRANT_PREFER_GRPC", "").lower() in (
+                    "1",
+                    "true",
+                    "yes",
+                )
+            # gRPC sends vectors as protobuf instead of JSON float lists
+            grpc_port = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+            logger.info(
+                f"Connecting to Qdrant server: {qdrant_url} "
+                f"(transport: {'gRPC:' + str(grpc_port) if prefer_grpc else 'HTTP'})"
+            )
+            self.client = _get_qdrant_client(
+                qdrant_url=qdrant_url, prefer_grpc=prefer_grpc, grpc_port=grpc_port
+            )
         elif db_path:
             logger.info(f"Using Qdrant local storage: {db_path}")
             self.db_path = Path(db_path)
-            self.client = QdrantClient(path=str(self.db_path))
+            self.client = _get_qdrant_client(db_path=str(self.db_path))
         else:
             raise ValueError("Either db_path or qdrant_url must be provided")
 
@@ -69,6 +150,18 @@ class VectorDBClient:
         self._embedder = None  # Lazy-loaded on first use
         self._embedder_lock = threading.Lock()  # Thread-safe lazy loading
         self._dimensions_verified = False
+        # Serializes read-modify-write of the index timestamp metadata point
+        self._metadata_lock = threading.Lock()
+        # (collection info, monotonic fetch time); reset whenever points change
+        self._collection_info: Optional[Dict[str, Any]] = None
+        self._collection_info_at = 0.0
+        # (index timestamps, monotonic fetch time); reset by set_index_timestamp
+        self._index_timestamps: Optional[Dict[str, Optional[str]]] = None
+        self._index_timestamps_at = 0.0
+        # Bounded LRU of query text -> float32 embedding (repeat queries skip
+        # the model forward pass)
+        self._query_embeddings: "OrderedDict[str, Any]" = OrderedDict()
+        self._query_embeddings_lock = threading.Lock()
 
         # Create collection if it doesn't exist
         self._ensure_collection()
@@ -83,23 +176,10 @@ class VectorDBClient:
             with self._embedder_lock:
                 # Double-check pattern to prevent race conditions
                 if self._embedder is None:
-                    # Lazy import - only load PyTorch when actually needed
-                    from sentence_transformers import SentenceTransformer
-
-                    if self.model_cache_dir:
-                        logger.info(
-                            f"Loading embedding model: {self.embedding_model_name} "
-                            f"(from cache: {self.model_cache_dir})"
-                        )
-                        self._embedder = SentenceTransformer(
-                            self.embedding_model_name,
-                            cache_folder=self.model_cache_dir,
-                        )
-                    else:
-                        logger.info(
-                            f"Loading embedding model: {self.embedding_model_name}"
-                        )
-                        self._embedder = SentenceTransformer(self.embedding_model_name)
+                    # Shared across clients so the model is loaded once per process
+                    self._embedder = get_model(
+                        self.embedding_model_name, self.model_cache_dir
+                    )
 
                     # Verify dimensions on first load
                     if not self._dimensions_verified:
@@ -133,9 +213,11 @@ class VectorDBClient:
 
     def _ensure_collection(self):
         """Create collection if it doesn't exist and validate vector dimensions"""
+        payload_schema = {}
         try:
             collection = self.client.get_collection(self.collection_name)
             logger.info(f"Collection '{self.collection_name}' exists")
+            payload_schema = collection.payload_schema or {}
 
             # Validate vector dimensions match
             existing_size = collection.config.params.vectors.size
@@ -154,7 +236,8 @@ class VectorDBClient:
                     f"curl -X DELETE http://localhost:6333/collections/{self.collection_name}"
                 )
         except Exception as e:
-            if "not found" in str(e).lower() or "does not exist" in str(e).lower():
+            message = str(e).lower()
+            if "not found" in message or "does not exist" in message:
                 logger.info(f"Creating collection '{self.collection_name}'")
                 self.client.create_collection(
                     collection_name=self.collection_name,
@@ -166,6 +249,28 @@ class VectorDBClient:
                 # Re-raise if it's a dimension mismatch error
                 raise
 
+        self._ensure_payload_indexes(payload_schema)
+
+    def _ensure_payload_indexes(self, payload_schema: Dict[str, Any]):
+        """
+        Create payload indexes for filtered fields that are not indexed yet.
+
+        Args:
+            payload_schema: Payload schema from the collection info; fields
+                already in it are skipped, so no write is issued
+        """
+        for field_name, field_schema in PAYLOAD_INDEXES.items():
+            if field_name in payload_schema:
+                continue
+            try:
+                self.client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name=field_name,
+                    field_schema=field_schema,
+                )
+            except Exception as e:
+                logger.warning(f"Could not create payload index '{field_name}': {e}")
+
     def embed_texts(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings for a list of texts.
@@ -176,10 +281,31 @@ class VectorDBClient:
         Returns:
             List of embedding vectors
         """
-        embeddings = self.embedder.encode(
-            texts, show_progress_bar=False, convert_to_numpy=True
-        )
-        return embeddings.tolist()
+        return encode(self.embedder, texts).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        """
+        Generate the embedding for a single query, reusing recent results.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Embedding vector
+        """
+        with self._query_embeddings_lock:
+            cached = self._query_embeddings.get(text)
+            if cached is not None:
+                self._query_embeddings.move_to_end(text)
+                return cached.tolist()
+
+        embedding = encode(self.embedder, [text])[0]
+
+        with self._query_embeddings_lock:
+            self._query_embeddings[text] = embedding
+            if len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_embeddings.popitem(last=False)
+        return embedding.tolist()
 
     def index_chunks(self, chunks: List[Dict[str, Any]], batch_size: int = 32) -> int:
         """
@@ -223,9 +349,10 @@ class VectorDBClient:
 
             total_indexed += len(points)
 
-            logger.debug(f"Indexed batch {i // batch_size + 1}: {len(points)} chunks")
+            logger.debug("Indexed batch", batch=i // batch_size + 1, chunks=len(points))
 
-        logger.info(f"Indexed {total_indexed} chunks total")
+        self._collection_info = None
+        logger.info("Indexed chunks", total=total_indexed)
         return total_indexed
 
     def search(
@@ -247,33 +374,47 @@ class VectorDBClient:
         Returns:
             List of results with text, metadata, and scores
         """
+        # An empty query only lists matching chunks; scan payloads by filter
+        # instead of embedding "" and ranking against a meaningless vector
+        if not query:
+            return [
+                {"text": chunk["text"], "score": 1.0, "metadata": chunk["metadata"]}
+                for chunk in self.list_chunks(filters=filters, limit=limit)
+            ]
+
         # Generate query embedding
-        query_embedding = self.embed_texts([query])[0]
-
-        # Build filter if provided
-        qdrant_filter = None
-        if filters:
-            conditions = []
-            for key, value in filters.items():
-                if isinstance(value, list):
-                    # Multiple values (OR condition)
-                    for v in value:
-                        conditions.append(
-                            FieldCondition(key=key, match=MatchValue(value=v))
-                        )
-                else:
-                    conditions.append(
-                        FieldCondition(key=key, match=MatchValue(value=value))
-                    )
+        query_embedding = self.embed_query(query)
+
+        return self.search_by_vector(
+            query_embedding,
+            filters=filters,
+            limit=limit,
+            score_threshold=score_threshold,
+        )
+
+    def search_by_vector(
+        self,
+        vector: List[float],
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 20,
+        score_threshold: float = 0.7,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for chunks similar to an existing embedding (no embedding call).
 
-            if conditions:
-                qdrant_filter = Filter(must=conditions)
+        Args:
+            vector: Query embedding
+            filters: Optional filters (e.g., {'chapter_number': 9})
+            limit: Maximum number of results
+            score_threshold: Minimum similarity score (0-1)
 
-        # Search
+        Returns:
+            List of results with text, metadata, and scores
+        """
         results = self.client.query_points(
             collection_name=self.collection_name,
-            query=query_embedding,
-            query_filter=qdrant_filter,
+            query=vector,
+            query_filter=self._build_filter(filters),
             limit=limit,
             score_threshold=score_threshold,
         ).points
@@ -288,6 +429,145 @@ class VectorDBClient:
             for result in results
         ]
 
+    def search_batch(
+        self,
+        queries: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 20,
+        score_threshold: float = 0.7,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several searches with one embedding pass and one Qdrant request.
+
+        Args:
+            queries: Search query texts
+            filters: Optional filters applied to every query
+            limit: Maximum number of results per query
+            score_threshold: Minimum similarity score (0-1)
+
+        Returns:
+            One result list per query, in the same order as queries
+        """
+        if not queries:
+            return []
+
+        return self.search_batch_by_vectors(
+            self.embed_texts(queries),
+            filters=filters,
+            limit=limit,
+            score_threshold=score_threshold,
+        )
+
+    def search_batch_by_vectors(
+        self,
+        vectors: List[List[float]],
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 20,
+        score_threshold: float = 0.7,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several searches for precomputed embeddings in one Qdrant request.
+
+        Args:
+            vectors: Query embeddings
+            filters: Optional filters applied to every query
+            limit: Maximum number of results per query
+            score_threshold: Minimum similarity score (0-1)
+
+        Returns:
+            One result list per vector, in the same order as vectors
+        """
+        if not vectors:
+            return []
+
+        query_filter = self._build_filter(filters)
+        requests = [
+            QueryRequest(
+                query=vector,
+                filter=query_filter,
+                limit=limit,
+                score_threshold=score_threshold,
+                with_payload=True,
+            )
+            for vector in vectors
+        ]
+
+        responses = self.client.query_batch_points(
+            collection_name=self.collection_name, requests=requests
+        )
+
+        return [
+            [
+                {
+                    "text": point.payload["text"],
+                    "score": point.score,
+                    "metadata": {k: v for k, v in point.payload.items() if k != "text"},
+                }
+                for point in response.points
+            ]
+            for response in responses
+        ]
+
+    def list_chunks(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        with_vectors: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        List chunks matching filters without embedding a query.
+
+        Use this instead of searching with a placeholder query when only the
+        matching chunks are needed, not their similarity to anything.
+
+        Args:
+            filters: Optional filters (e.g., {'chapter_number': 9})
+            limit: Maximum number of results
+            with_vectors: Include each chunk's stored embedding under 'vector'
+
+        Returns:
+            List of dicts with 'text' and 'metadata' (and 'vector' if requested)
+        """
+        points, _ = self.client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=self._build_filter(filters),
+            limit=limit,
+            with_payload=True,
+            with_vectors=with_vectors,
+        )
+
+        chunks = []
+        for point in points:
+            chunk = {
+                "text": point.payload.get("text", ""),
+                "metadata": {k: v for k, v in point.payload.items() if k != "text"},
+            }
+            if with_vectors:
+                chunk["vector"] = point.vector
+            chunks.append(chunk)
+        return chunks
+
+    @staticmethod
+    def _build_filter(filters: Optional[Dict[str, Any]]) -> Optional[Filter]:
+        """Build a Qdrant filter from a metadata dict (list values add conditions)."""
+        if not filters:
+            return None
+
+        conditions = []
+        for key, value in filters.items():
+            if isinstance(value, list):
+                # Multiple values (OR condition)
+                for v in value:
+                    conditions.append(
+                        FieldCondition(key=key, match=MatchValue(value=v))
+                    )
+            else:
+                conditions.append(
+                    FieldCondition(key=key, match=MatchValue(value=value))
+                )
+
+        return Filter(must=conditions) if conditions else None
+
     def query_by_metadata(
         self, filter_dict: Dict[str, Any], limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
@@ -349,8 +629,10 @@ class VectorDBClient:
             offset = next_offset
 
         logger.debug(
-            f"Retrieved {len(results)} points with filter {filter_dict} "
-            f"(limit={limit or 'unlimited'})"
+            "Retrieved points by metadata",
+            count=len(results),
+            filters=filter_dict,
+            limit=limit,
         )
         return results
 
@@ -373,8 +655,9 @@ class VectorDBClient:
         self.client.delete(
             collection_name=self.collection_name, points_selector=qdrant_filter
         )
+        self._collection_info = None
 
-        logger.info(f"Deleted points matching {filters}")
+        logger.info("Deleted points", filters=filters)
         return True
 
     def delete_by_source(self, source_type: str) -> bool:
@@ -431,7 +714,9 @@ class VectorDBClient:
             if result["metadata"].get("scrivener_id")
         }
 
-        logger.debug(f"Found {len(scrivener_ids)} unique scrivener IDs in vector DB")
+        logger.debug(
+            "Found unique scrivener IDs in vector DB", count=len(scrivener_ids)
+        )
         return scrivener_ids
 
     def delete_orphaned_scrivener_docs(self, valid_ids: set) -> int:
@@ -467,15 +752,35 @@ class VectorDBClient:
         logger.info(f"Deleted {total_deleted} orphaned chunks total")
         return len(orphaned_ids)
 
-    def get_collection_info(self) -> Dict[str, Any]:
-        """Get collection statistics"""
+    def get_collection_info(
+        self, max_age: float = COLLECTION_INFO_TTL
+    ) -> Dict[str, Any]:
+        """
+        Get collection statistics.
+
+        Results are reused for up to max_age seconds; writes through this
+        client (index_chunks, delete_by_filter) invalidate the cached copy.
+
+        Args:
+            max_age: Maximum age in seconds of a cached result (0 = always fetch)
+
+        Returns:
+            Dict with name, points_count and status
+        """
+        cached = self._collection_info
+        if cached is not None and time.monotonic() - self._collection_info_at < max_age:
+            return dict(cached)
+
         info = self.client.get_collection(self.collection_name)
 
-        return {
+        result = {
             "name": self.collection_name,
             "points_count": info.points_count,
             "status": info.status,
         }
+        self._collection_info = result
+        self._collection_info_at = time.monotonic()
+        return dict(result)
 
     def _generate_id(self, chunk: Dict[str, Any]) -> str:
         """Generate unique UUID for a chunk"""
@@ -505,36 +810,59 @@ class VectorDBClient:
         # UUID v5 from DNS namespace and a fixed string
         metadata_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, "book_research_metadata"))
 
-        # Get existing metadata or create new
-        try:
-            existing = self.client.retrieve(
-                collection_name=self.collection_name, ids=[metadata_id]
-            )
-            payload = existing[0].payload if existing else {}
-        except Exception:
-            payload = {}
+        with self._metadata_lock:
+            # Get existing metadata or create new
+            try:
+                existing = self.client.retrieve(
+                    collection_name=self.collection_name, ids=[metadata_id]
+                )
+                payload = existing[0].payload if existing else {}
+            except Exception:
+                payload = {}
 
-        # Update timestamp
-        key = f"last_indexed_{source_type}"
-        payload[key] = timestamp
+            # Update timestamp
+            key = f"last_indexed_{source_type}"
+            payload[key] = timestamp
 
-        # Create zero vector for metadata point
-        zero_vector = [0.0] * self.vector_size
+            # Create zero vector for metadata point
+            zero_vector = [0.0] * self.vector_size
 
-        # Upsert metadata point
-        self.client.upsert(
-            collection_name=self.collection_name,
-            points=[PointStruct(id=metadata_id, vector=zero_vector, payload=payload)],
-        )
+            # Upsert metadata point
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=[
+                    PointStruct(id=metadata_id, vector=zero_vector, payload=payload)
+                ],
+            )
+            self._index_timestamps = None
 
         logger.info(f"Updated {source_type} index timestamp: {timestamp}")
 
-    def get_index_timestamps(self) -> Dict[str, Optional[str]]:
+    def get_index_timestamps(
+        self, max_age: float = INDEX_TIMESTAMPS_TTL
+    ) -> Dict[str, Optional[str]]:
         """Get last index timestamps for all source types.
 
+        Args:
+            max_age: Maximum age in seconds of a cached result (0 = always fetch)
+
         Returns:
             Dict with 'zotero' and 'scrivener' timestamp keys
         """
+        cached = self._index_timestamps
+        if (
+            cached is not None
+            and time.monotonic() - self._index_timestamps_at < max_age
+        ):
+            return dict(cached)
+
+        timestamps = self._fetch_index_timestamps()
+        self._index_timestamps = timestamps
+        self._index_timestamps_at = time.monotonic()
+        return dict(timestamps)
+
+    def _fetch_index_timestamps(self) -> Dict[str, Optional[str]]:
+        """Read the index timestamps from the metadata point."""
         import uuid
 
         # Use the same deterministic UUID
@@ -570,7 +898,7 @@ class VectorDBClient:
         if points_count == 0:
             return False
 
-        timestamps = self.get_index_timestamps()
+        timestamps = self.get_index_timestamps(max_age=0)
 
         # If we have data but no timestamps, backfill them
         if timestamps["zotero"] is None and timestamps["scrivener"] is None:
@@ -626,8 +954,6 @@ def create_client(config: Dict[str, Any]) -> VectorDBClient:
     Returns:
         VectorDBClient instance
     """
-    import os
-
     # Check if using Qdrant server or local storage
     qdrant_url = os.getenv("QDRANT_URL")
 
@@ -8,7 +8,8 @@ Runs scheduled reindexing of Zotero and Scrivener on fixed intervals:
 Missed runs are skipped (no catch-up).
 """
 
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
@@ -57,6 +58,10 @@ class FileWatcherDaemon:
         self.last_zotero_reindex: Optional[datetime] = None
         self.last_scrivener_reindex: Optional[datetime] = None
 
+        # Set by stop(); the loop waits on it between checks so shutdown is
+        # observed immediately instead of after a full check interval
+        self._stop_event = threading.Event()
+
     def start(self):
         """Start scheduled reindexing loop"""
         logger.info("Starting scheduled reindexing daemon")
@@ -65,28 +70,39 @@ class FileWatcherDaemon:
         logger.info(f"Checking every {self.CHECK_INTERVAL} seconds")
 
         try:
-            while True:
+            while not self._stop_event.is_set():
                 now = datetime.now()
 
-                # Check if it's time to reindex Zotero
+                # Collect the reindexes that are due
+                due = []
                 if self._should_reindex_zotero(now):
-                    self._reindex_zotero()
+                    due.append(self._reindex_zotero)
                     self.last_zotero_reindex = now
-
-                # Check if it's time to reindex Scrivener
                 if self._should_reindex_scrivener(now):
-                    self._reindex_scrivener()
+                    due.append(self._reindex_scrivener)
                     self.last_scrivener_reindex = now
 
-                # Sleep until next check
-                time.sleep(self.CHECK_INTERVAL)
+                # The sources are independent, so run them side by side when
+                # both are due (always the case on the first check)
+                if len(due) > 1:
+                    with ThreadPoolExecutor(
+                        max_workers=len(due), thread_name_prefix="reindex"
+                    ) as pool:
+                        for future in [pool.submit(job) for job in due]:
+                            future.result()
+                elif due:
+                    due[0]()
+
+                # Sleep until next check (or until stop() is called)
+                self._stop_event.wait(self.CHECK_INTERVAL)
 
         except KeyboardInterrupt:
             self.stop()
 
     def stop(self):
-        """Stop the daemon"""
+        """Stop the daemon (safe to call from another thread or a signal handler)"""
         logger.info("Stopping scheduled reindexing daemon")
+        self._stop_event.set()
 
     def _should_reindex_zotero(self, now: datetime) -> bool:
         """Check if it's time to reindex Zotero"""
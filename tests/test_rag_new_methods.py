@@ -137,6 +137,9 @@ def test_source_diversity(rag, mock_vectordb):
         )
 
     mock_vectordb.scroll.return_value = (mixed_results, None)
+    mock_vectordb.search.return_value = [
+        {"text": "", "score": 1.0, "metadata": r.payload} for r in mixed_results
+    ]
 
     # Test diversity analysis
     results = rag.analyze_source_diversity(5)
@@ -332,10 +335,18 @@ def test_suggest_related_research(rag, mock_vectordb):
     """Test related research suggestions."""
     print("\n🧪 Testing Related Research Suggestions\n")
 
-    # Mock search to return proper dict results
-    chapter_search_results = [
-        {"text": "Chapter 5 content about topic A", "metadata": {"chapter_number": 5}},
-        {"text": "More chapter 5 content", "metadata": {"chapter_number": 5}},
+    # Mock chapter listing to return chunks with their stored embeddings
+    chapter_chunks = [
+        {
+            "text": "Chapter 5 content about topic A",
+            "metadata": {"chapter_number": 5},
+            "vector": [1.0, 0.0],
+        },
+        {
+            "text": "More chapter 5 content",
+            "metadata": {"chapter_number": 5},
+            "vector": [0.0, 1.0],
+        },
     ]
 
     related_search_results = [
@@ -359,12 +370,24 @@ def test_suggest_related_research(rag, mock_vectordb):
         },
     ]
 
-    # Mock search to return chapter content first, then related content
-    with patch.object(rag, "search") as mock_search:
-        mock_search.side_effect = [chapter_search_results, related_search_results]
+    mock_vectordb.list_chunks.return_value = chapter_chunks
+    mock_vectordb.search_by_vector.return_value = related_search_results
+
+    from src.rag import RELATED_RESEARCH_SAMPLE_SIZE
 
+    # Related content is found from the chapter centroid without re-embedding
+    with patch.object(rag, "search") as mock_search:
         results = rag.suggest_related_research(5, limit=5)
 
+        mock_search.assert_not_called()
+        mock_vectordb.list_chunks.assert_called_once_with(
+            filters={"chapter_number": 5},
+            limit=RELATED_RESEARCH_SAMPLE_SIZE,
+            with_vectors=True,
+        )
+        centroid = mock_vectordb.search_by_vector.call_args[0][0]
+        assert centroid == [0.5, 0.5]
+
         # Verify results structure
         assert "chapter" in results
         assert results["chapter"] == 5
@@ -377,6 +400,111 @@ def test_suggest_related_research(rag, mock_vectordb):
         print(f"✅ From chapters: {results['chapters_with_suggestions']}")
 
 
+def test_search_batch(rag, mock_vectordb):
+    """Test batched search shares one embedding pass and one Qdrant request."""
+    print("\n🧪 Testing Batched Search\n")
+
+    mock_vectordb.embed_texts.return_value = [[1.0, 0.0], [0.0, 1.0]]
+    mock_vectordb.search_batch_by_vectors.return_value = [
+        [{"text": "Heat", "score": 0.9, "metadata": {"chapter_number": 3}}],
+        [],
+    ]
+
+    results = rag.search_batch(["urban heat", "tree canopy"], limit=5)
+
+    mock_vectordb.embed_texts.assert_called_once_with(["urban heat", "tree canopy"])
+    mock_vectordb.search_batch_by_vectors.assert_called_once()
+    assert [len(r) for r in results] == [1, 0]
+
+    # Repeating a query is served from the search cache
+    results = rag.search_batch(["urban heat"], limit=5)
+    assert results[0][0]["text"] == "Heat"
+    assert mock_vectordb.search_batch_by_vectors.call_count == 1
+    print("✅ Batched and cached results returned in query order")
+
+
+def test_search_cache_invalidated_by_reindex(rag, mock_vectordb):
+    """Search results cached before a re-index are not served after it."""
+    print("\n🧪 Testing Search Cache Invalidation\n")
+
+    mock_vectordb.get_index_timestamps.return_value = {
+        "zotero": "2024-01-01T00:00:00",
+        "scrivener": None,
+    }
+    mock_vectordb.embed_query.return_value = [1.0, 0.0]
+    mock_vectordb.search_by_vector.return_value = [
+        {"text": "Old", "score": 0.9, "metadata": {}}
+    ]
+
+    assert rag.search("urban heat")[0]["text"] == "Old"
+    assert rag.search("urban heat")[0]["text"] == "Old"
+    assert mock_vectordb.search_by_vector.call_count == 1
+
+    # Re-index: new timestamps, new results
+    mock_vectordb.get_index_timestamps.return_value = {
+        "zotero": "2024-01-02T00:00:00",
+        "scrivener": None,
+    }
+    mock_vectordb.search_by_vector.return_value = [
+        {"text": "New", "score": 0.9, "metadata": {}}
+    ]
+
+    assert rag.search("urban heat")[0]["text"] == "New"
+    assert rag.search("urban heating")[0]["text"] == "New"
+    assert mock_vectordb.search_by_vector.call_count == 2
+    print("✅ Re-index invalidates cached search results")
+
+
+def test_find_facts_without_stored_facts(rag, mock_vectordb):
+    """Chunks indexed before facts were stored fall back to extraction."""
+    print("\n🧪 Testing Fact Search Without Stored Facts\n")
+
+    mock_vectordb.embed_query.return_value = [1.0, 0.0]
+    legacy_hit = {
+        "text": "Urban heat raised energy use by 12 percent in the study area.",
+        "score": 0.8,
+        "metadata": {"title": "Heat Study", "chapter_number": 3},
+    }
+    # No chunk matches the fact filters; the plain Zotero search does
+    mock_vectordb.search_by_vector.side_effect = [[], [legacy_hit]]
+
+    result = rag.find_facts("urban heat", fact_type="statistic")
+
+    assert result["fact_count"] == 1
+    assert result["facts"][0]["value"] == "12 percent"
+    assert result["facts"][0]["source"] == "Heat Study"
+    assert "reindex.py" in result["note"]
+    print("✅ Facts extracted at query time with a re-index note")
+
+
+def test_check_sync_classifies_mismatches(rag):
+    """Sync check handles chapter 0 (Preface) and reports each mismatch once."""
+    print("\n🧪 Testing Sync Mismatch Classification\n")
+
+    with patch.object(
+        rag, "_extract_chapters_from_outline", return_value={0: "Preface", 1: "One"}
+    ):
+        with patch.object(
+            rag,
+            "_get_indexed_chapters",
+            side_effect=lambda source: {
+                "zotero": {1: {}, 3: {}},
+                "scrivener": {0: {}, 1: {}, 2: {}},
+            }[source],
+        ):
+            result = rag.check_sync()
+
+    assert [(m["chapter"], m["type"]) for m in result["mismatches"]] == [
+        (0, "missing_from_zotero"),
+        (2, "missing_from_zotero"),
+        (3, "missing_from_scrivener"),
+    ]
+    assert result["recommendations"][0] == (
+        "Create Zotero collections for chapters: 0, 2"
+    )
+    print("✅ Mismatches classified per chapter")
+
+
 def test_error_handling(rag, mock_vectordb):
     """Test error handling for invalid inputs."""
     print("\n🧪 Testing Error Handling\n")
@@ -0,0 +1,24 @@
+"""Test ResponseCache expiry."""
+
+import sqlite3
+from unittest.mock import patch
+
+from src.response_cache import ResponseCache
+
+
+def test_expired_entries_are_deleted(tmp_path):
+    """Expired rows are removed on read and purged on write."""
+    path = tmp_path / "cache.db"
+    cache = ResponseCache(path=str(path), ttl=10)
+
+    with patch("src.response_cache.time.time", return_value=1000.0):
+        cache.set("old", {"value": 1})
+        cache.set("stale", {"value": 2})
+        assert cache.get("old") == {"value": 1}
+
+    with patch("src.response_cache.time.time", return_value=2000.0):
+        assert cache.get("old") is None
+        cache.set("new", {"value": 3})
+
+    keys = sqlite3.connect(path).execute("SELECT key FROM responses").fetchall()
+    assert keys == [("new",)]
@@ -41,6 +41,38 @@ def test_get_chapter_structure(scrivener_path):
         print(f"  Chapter {ch['number']}: {ch['title']}")
 
 
+def test_chapter_structure_cached_until_file_changes(tmp_path, monkeypatch):
+    """Binder XML is parsed once per .scrivx revision; callers get copies."""
+    project = tmp_path / "Book.scriv"
+    project.mkdir()
+    scrivx = project / "Book.scrivx"
+    scrivx.write_text(
+        "<ScrivenerProject><Binder>"
+        '<BinderItem UUID="a" Type="Folder"><Title>1. Opening</Title></BinderItem>'
+        "</Binder></ScrivenerProject>"
+    )
+
+    parser = ScrivenerParser(str(project))
+    calls = []
+    original = parser._parse_chapter_structure
+
+    def counting_parse():
+        calls.append(1)
+        return original()
+
+    monkeypatch.setattr(parser, "_parse_chapter_structure", counting_parse)
+
+    first = parser.get_chapter_structure()
+    first["chapters"].clear()
+    assert parser.get_chapter_structure()["chapters"]
+    assert len(calls) == 1
+
+    scrivx.write_text(scrivx.read_text().replace("Opening", "Beginning"))
+    os.utime(scrivx, ns=(0, scrivx.stat().st_mtime_ns + 1))
+    assert parser.get_chapters_by_number()[1]["title"] == "1. Beginning"
+    assert len(calls) == 2
+
+
 def test_format_structure_as_text(scrivener_path):
     """Test formatting structure as text."""
     parser = ScrivenerParser(scrivener_path)
@@ -0,0 +1,120 @@
+"""Test VectorDBClient search behaviour."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def vectordb():
+    """Fixture to create VectorDBClient with a mocked Qdrant connection."""
+    from src.vectordb.client import VectorDBClient
+
+    with patch("src.vectordb.client._get_qdrant_client") as mock_get_client:
+        with patch("src.vectordb.client.encode") as mock_encode:
+            with patch.object(VectorDBClient, "_ensure_collection"):
+                mock_get_client.return_value = MagicMock()
+                mock_encode.return_value = np.array([[0.1, 0.2]], dtype=np.float32)
+                client = VectorDBClient(qdrant_url="http://localhost:6333")
+                client._embedder = MagicMock()
+                client.encode = mock_encode
+                yield client
+
+
+def test_empty_query_uses_scroll(vectordb):
+    """Empty queries scan payloads via scroll instead of embedding."""
+    points = [
+        MagicMock(
+            payload={"text": f"Chunk {i}", "chapter_number": 5, "title": "Source"}
+        )
+        for i in range(3)
+    ]
+    vectordb.client.scroll.return_value = (points, None)
+
+    results = vectordb.search("", filters={"chapter_number": 5}, limit=50)
+
+    vectordb.encode.assert_not_called()
+    vectordb.client.query_points.assert_not_called()
+
+    scroll_kwargs = vectordb.client.scroll.call_args.kwargs
+    assert scroll_kwargs["limit"] == 50
+    assert scroll_kwargs["scroll_filter"].must[0].key == "chapter_number"
+
+    # Scroll points map onto the same shape as vector hits
+    assert results == [
+        {
+            "text": f"Chunk {i}",
+            "score": 1.0,
+            "metadata": {"chapter_number": 5, "title": "Source"},
+        }
+        for i in range(3)
+    ]
+
+
+def test_non_empty_query_embeds_and_queries(vectordb):
+    """Non-empty queries still go through embedding and vector search."""
+    vectordb.client.query_points.return_value = MagicMock(
+        points=[MagicMock(score=0.9, payload={"text": "Hit", "chapter_number": 2})]
+    )
+
+    results = vectordb.search("resilience", limit=5)
+
+    vectordb.encode.assert_called_once_with(vectordb._embedder, ["resilience"])
+    vectordb.client.scroll.assert_not_called()
+    assert results == [{"text": "Hit", "score": 0.9, "metadata": {"chapter_number": 2}}]
+
+
+def test_repeat_query_reuses_embedding(vectordb):
+    """Repeated queries hit the embedding LRU instead of the model."""
+    vectordb.client.query_points.return_value = MagicMock(points=[])
+
+    vectordb.search("resilience", limit=5)
+    vectordb.search("resilience", limit=20)
+
+    vectordb.encode.assert_called_once()
+    assert vectordb.embed_query("resilience") == pytest.approx([0.1, 0.2])
+    assert vectordb.encode.call_count == 1
+
+
+def test_collection_info_is_cached_until_write(vectordb):
+    """Collection info is served from cache until this client writes."""
+    vectordb.client.get_collection.return_value = MagicMock(
+        points_count=42, status="green"
+    )
+
+    assert vectordb.get_collection_info()["points_count"] == 42
+    assert vectordb.get_collection_info()["points_count"] == 42
+    assert vectordb.client.get_collection.call_count == 1
+
+    vectordb.delete_by_filter({"source_type": "zotero"})
+    vectordb.get_collection_info()
+    assert vectordb.client.get_collection.call_count == 2
+
+    vectordb.get_collection_info(max_age=0)
+    assert vectordb.client.get_collection.call_count == 3
+
+
+def test_index_timestamps_are_cached_until_set(vectordb):
+    """Index timestamps are re-read only after expiry or a local update."""
+    vectordb.client.retrieve.return_value = [
+        MagicMock(payload={"last_indexed_zotero": "2024-01-01T00:00:00"})
+    ]
+
+    assert vectordb.get_index_timestamps()["zotero"] == "2024-01-01T00:00:00"
+    vectordb.get_index_timestamps()
+    assert vectordb.client.retrieve.call_count == 1
+
+    vectordb.set_index_timestamp("scrivener", "2024-01-02T00:00:00")
+    calls = vectordb.client.retrieve.call_count
+    vectordb.get_index_timestamps()
+    assert vectordb.client.retrieve.call_count == calls + 1
+
+
+def test_payload_indexes_skip_existing_fields(vectordb):
+    """Payload indexes already in the collection schema are not re-created."""
+    vectordb._ensure_payload_indexes({"fact_types": MagicMock()})
+    vectordb.client.create_payload_index.assert_not_called()
+
+    vectordb._ensure_payload_indexes({})
+    assert vectordb.client.create_payload_index.call_count == 1